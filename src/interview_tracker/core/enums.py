@@ -1,9 +1,24 @@
 """Enumerations for Interview Tracker."""
 
-from enum import Enum
+from enum import Enum, IntEnum
 
+try:
+    from enum import StrEnum
+except ImportError:  # Python < 3.11
+    class StrEnum(str, Enum):
+        """Backport of enum.StrEnum: members are str instances and str() gives the value."""
 
-class PipelineStage(str, Enum):
+        def __str__(self) -> str:
+            return str.__str__(self)
+
+
+def _attach(enum_cls, attr: str, mapping: dict) -> None:
+    """Store precomputed per-member values directly on the enum members."""
+    for member in enum_cls:
+        setattr(member, attr, mapping[member])
+
+
+class PipelineStage(StrEnum):
     """Pipeline stages representing the interview process."""
     APPLIED = "applied"
     RECRUITER_SCREEN = "recruiter_screen"
@@ -20,28 +35,38 @@ class PipelineStage(str, Enum):
     @property
     def display_name(self) -> str:
         """Human-readable display name."""
-        names = {
-            "applied": "Applied",
-            "recruiter_screen": "Recruiter Screen",
-            "tech_round_1": "Technical Round 1",
-            "tech_round_2": "Technical Round 2",
-            "system_design": "System Design",
-            "ai_round": "AI / GenAI Round",
-            "hm_round": "Hiring Manager",
-            "final_culture": "Final / Culture",
-            "offer": "Offer",
-            "rejected": "Rejected",
-            "dropped": "Dropped",
-        }
-        return names.get(self.value, self.value)
+        return self._display_name
 
     @property
     def is_terminal(self) -> bool:
         """Check if this is a terminal state."""
-        return self in {PipelineStage.OFFER, PipelineStage.REJECTED, PipelineStage.DROPPED}
+        return self._is_terminal
+
+
+_PIPELINE_STAGE_NAMES = {
+    PipelineStage.APPLIED: "Applied",
+    PipelineStage.RECRUITER_SCREEN: "Recruiter Screen",
+    PipelineStage.TECH_ROUND_1: "Technical Round 1",
+    PipelineStage.TECH_ROUND_2: "Technical Round 2",
+    PipelineStage.SYSTEM_DESIGN: "System Design",
+    PipelineStage.AI_ROUND: "AI / GenAI Round",
+    PipelineStage.HM_ROUND: "Hiring Manager",
+    PipelineStage.FINAL_CULTURE: "Final / Culture",
+    PipelineStage.OFFER: "Offer",
+    PipelineStage.REJECTED: "Rejected",
+    PipelineStage.DROPPED: "Dropped",
+}
+_TERMINAL_STAGES = frozenset({
+    PipelineStage.OFFER, PipelineStage.REJECTED, PipelineStage.DROPPED
+})
+_attach(PipelineStage, "_display_name", _PIPELINE_STAGE_NAMES)
+_attach(PipelineStage, "_is_terminal", {s: s in _TERMINAL_STAGES for s in PipelineStage})
+
+# Display names keyed by stored value, for per-row lookups without building enums
+STAGE_DISPLAY = {s.value: s.display_name for s in PipelineStage}
 
 
-class InterviewMode(str, Enum):
+class InterviewMode(StrEnum):
     """Interview delivery mode."""
     VIDEO = "video"
     PHONE = "phone"
@@ -50,16 +75,19 @@ class InterviewMode(str, Enum):
 
     @property
     def display_name(self) -> str:
-        names = {
-            "video": "Video Call",
-            "phone": "Phone",
-            "onsite": "On-site",
-            "take_home": "Take-home",
-        }
-        return names.get(self.value, self.value)
+        return self._display_name
 
 
-class InterviewOutcome(str, Enum):
+_attach(InterviewMode, "_display_name", {
+    InterviewMode.VIDEO: "Video Call",
+    InterviewMode.PHONE: "Phone",
+    InterviewMode.ONSITE: "On-site",
+    InterviewMode.TAKE_HOME: "Take-home",
+})
+MODE_DISPLAY = {m.value: m.display_name for m in InterviewMode}
+
+
+class InterviewOutcome(StrEnum):
     """Interview outcome status."""
     PENDING = "pending"
     PASSED = "passed"
@@ -68,10 +96,14 @@ class InterviewOutcome(str, Enum):
 
     @property
     def display_name(self) -> str:
-        return self.value.capitalize()
+        return self._display_name
+
 
+_attach(InterviewOutcome, "_display_name", {o: o.value.capitalize() for o in InterviewOutcome})
+OUTCOME_DISPLAY = {o.value: o.display_name for o in InterviewOutcome}
 
-class PrepStatus(str, Enum):
+
+class PrepStatus(StrEnum):
     """Preparation status for an interview."""
     NOT_STARTED = "not_started"
     IN_PROGRESS = "in_progress"
@@ -79,25 +111,28 @@ class PrepStatus(str, Enum):
 
     @property
     def display_name(self) -> str:
-        names = {
-            "not_started": "Not Started",
-            "in_progress": "In Progress",
-            "ready": "Ready",
-        }
-        return names.get(self.value, self.value)
+        return self._display_name
 
     @property
     def color(self) -> str:
         """Color for UI display."""
-        colors = {
-            "not_started": "#dc3545",  # Red
-            "in_progress": "#ffc107",  # Yellow
-            "ready": "#28a745",  # Green
-        }
-        return colors.get(self.value, "#6c757d")
+        return self._color
+
+
+_attach(PrepStatus, "_display_name", {
+    PrepStatus.NOT_STARTED: "Not Started",
+    PrepStatus.IN_PROGRESS: "In Progress",
+    PrepStatus.READY: "Ready",
+})
+PREP_DISPLAY = {p.value: p.display_name for p in PrepStatus}
+_attach(PrepStatus, "_color", {
+    PrepStatus.NOT_STARTED: "#dc3545",  # Red
+    PrepStatus.IN_PROGRESS: "#ffc107",  # Yellow
+    PrepStatus.READY: "#28a745",  # Green
+})
 
 
-class PipelineHealth(str, Enum):
+class PipelineHealth(StrEnum):
     """Calculated health status of a pipeline."""
     ACTIVE = "active"
     AWAITING = "awaiting"
@@ -107,41 +142,43 @@ class PipelineHealth(str, Enum):
 
     @property
     def display_name(self) -> str:
-        names = {
-            "active": "Active",
-            "awaiting": "Awaiting Response",
-            "needs_followup": "Needs Follow-up",
-            "stale": "Stale",
-            "closed": "Closed",
-        }
-        return names.get(self.value, self.value)
+        return self._display_name
 
     @property
     def color(self) -> str:
         """Color for UI display."""
-        colors = {
-            "active": "#28a745",  # Green
-            "awaiting": "#ffc107",  # Yellow
-            "needs_followup": "#fd7e14",  # Orange
-            "stale": "#dc3545",  # Red
-            "closed": "#6c757d",  # Gray
-        }
-        return colors.get(self.value, "#6c757d")
+        return self._color
 
     @property
     def emoji(self) -> str:
         """Emoji indicator for the health status."""
-        emojis = {
-            "active": "🟢",
-            "awaiting": "🟡",
-            "needs_followup": "🟠",
-            "stale": "🔴",
-            "closed": "⚫",
-        }
-        return emojis.get(self.value, "⚪")
+        return self._emoji
 
 
-class QuestionType(str, Enum):
+_attach(PipelineHealth, "_display_name", {
+    PipelineHealth.ACTIVE: "Active",
+    PipelineHealth.AWAITING: "Awaiting Response",
+    PipelineHealth.NEEDS_FOLLOWUP: "Needs Follow-up",
+    PipelineHealth.STALE: "Stale",
+    PipelineHealth.CLOSED: "Closed",
+})
+_attach(PipelineHealth, "_color", {
+    PipelineHealth.ACTIVE: "#28a745",  # Green
+    PipelineHealth.AWAITING: "#ffc107",  # Yellow
+    PipelineHealth.NEEDS_FOLLOWUP: "#fd7e14",  # Orange
+    PipelineHealth.STALE: "#dc3545",  # Red
+    PipelineHealth.CLOSED: "#6c757d",  # Gray
+})
+_attach(PipelineHealth, "_emoji", {
+    PipelineHealth.ACTIVE: "🟢",
+    PipelineHealth.AWAITING: "🟡",
+    PipelineHealth.NEEDS_FOLLOWUP: "🟠",
+    PipelineHealth.STALE: "🔴",
+    PipelineHealth.CLOSED: "⚫",
+})
+
+
+class QuestionType(StrEnum):
     """Type of interview question."""
     BEHAVIORAL = "behavioral"
     TECHNICAL = "technical"
@@ -152,18 +189,20 @@ class QuestionType(str, Enum):
 
     @property
     def display_name(self) -> str:
-        names = {
-            "behavioral": "Behavioral",
-            "technical": "Technical",
-            "system_design": "System Design",
-            "coding": "Coding",
-            "culture": "Culture Fit",
-            "other": "Other",
-        }
-        return names.get(self.value, self.value)
-
-
-class PrepCategory(str, Enum):
+        return self._display_name
+
+
+_attach(QuestionType, "_display_name", {
+    QuestionType.BEHAVIORAL: "Behavioral",
+    QuestionType.TECHNICAL: "Technical",
+    QuestionType.SYSTEM_DESIGN: "System Design",
+    QuestionType.CODING: "Coding",
+    QuestionType.CULTURE: "Culture Fit",
+    QuestionType.OTHER: "Other",
+})
+
+
+class PrepCategory(StrEnum):
     """Category for preparation topics."""
     DATA_STRUCTURES = "data_structures"
     ALGORITHMS = "algorithms"
@@ -175,19 +214,21 @@ class PrepCategory(str, Enum):
 
     @property
     def display_name(self) -> str:
-        names = {
-            "data_structures": "Data Structures",
-            "algorithms": "Algorithms",
-            "system_design": "System Design",
-            "behavioral": "Behavioral",
-            "domain_specific": "Domain Specific",
-            "ai_ml": "AI / Machine Learning",
-            "other": "Other",
-        }
-        return names.get(self.value, self.value)
-
-
-class Priority(int, Enum):
+        return self._display_name
+
+
+_attach(PrepCategory, "_display_name", {
+    PrepCategory.DATA_STRUCTURES: "Data Structures",
+    PrepCategory.ALGORITHMS: "Algorithms",
+    PrepCategory.SYSTEM_DESIGN: "System Design",
+    PrepCategory.BEHAVIORAL: "Behavioral",
+    PrepCategory.DOMAIN_SPECIFIC: "Domain Specific",
+    PrepCategory.AI_ML: "AI / Machine Learning",
+    PrepCategory.OTHER: "Other",
+})
+
+
+class Priority(IntEnum):
     """Priority level for pipelines."""
     LOW = 1
     MEDIUM = 2
@@ -195,24 +236,36 @@ class Priority(int, Enum):
     VERY_HIGH = 4
     CRITICAL = 5
 
+    @classmethod
+    def from_int(cls, value: int) -> "Priority":
+        """Coerce a stored priority value into a member."""
+        if 1 <= value <= 5:
+            return _PRIORITY_BY_INT[value]
+        raise ValueError(f"{value!r} is not a valid {cls.__name__}")
+
     @property
     def display_name(self) -> str:
-        names = {
-            1: "Low",
-            2: "Medium",
-            3: "High",
-            4: "Very High",
-            5: "Critical",
-        }
-        return names.get(self.value, str(self.value))
+        return self._display_name
 
     @property
     def color(self) -> str:
-        colors = {
-            1: "#6c757d",  # Gray
-            2: "#17a2b8",  # Cyan
-            3: "#ffc107",  # Yellow
-            4: "#fd7e14",  # Orange
-            5: "#dc3545",  # Red
-        }
-        return colors.get(self.value, "#6c757d")
+        return self._color
+
+
+# Priority values are contiguous from 1, so from_int indexes a tuple
+# directly; slot 0 is unused.
+_PRIORITY_BY_INT = (None, *Priority)
+_attach(Priority, "_display_name", {
+    Priority.LOW: "Low",
+    Priority.MEDIUM: "Medium",
+    Priority.HIGH: "High",
+    Priority.VERY_HIGH: "Very High",
+    Priority.CRITICAL: "Critical",
+})
+_attach(Priority, "_color", {
+    Priority.LOW: "#6c757d",  # Gray
+    Priority.MEDIUM: "#17a2b8",  # Cyan
+    Priority.HIGH: "#ffc107",  # Yellow
+    Priority.VERY_HIGH: "#fd7e14",  # Orange
+    Priority.CRITICAL: "#dc3545",  # Red
+})
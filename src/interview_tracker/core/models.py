@@ -2,12 +2,15 @@
 
 from datetime import datetime, date
 from typing import Optional, List
-import json
+import sqlite3
 
+import orjson
 from sqlalchemy import (
     String, Integer, Text, DateTime, Date, ForeignKey,
-    Boolean, create_engine, event
+    Boolean, Index, cast, create_engine, event, func
 )
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.orm import (
     DeclarativeBase, Mapped, mapped_column, relationship, Session
 )
@@ -17,15 +20,85 @@ from .enums import (
     QuestionType, PrepCategory, Priority
 )
 
+# Direct value -> member lookups; cheaper than going through Enum.__call__.
+_STAGES = PipelineStage._value2member_map_
+_MODES = InterviewMode._value2member_map_
+_OUTCOMES = InterviewOutcome._value2member_map_
+_PREP_STATUSES = PrepStatus._value2member_map_
+_QUESTION_TYPES = QuestionType._value2member_map_
+_PREP_CATEGORIES = PrepCategory._value2member_map_
+
+_loads = orjson.loads
+
+
+def _dumps(value: List[str]) -> str:
+    return orjson.dumps(value).decode()
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune a new SQLite connection for a single-user desktop workload."""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-64000")  # 64 MB
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.close()
+
+
+class StringList(TypeDecorator):
+    """A list of strings stored as a JSON array in a TEXT column.
+
+    Decoding happens once when the row is loaded, so attribute reads are
+    plain list accesses. Empty lists are stored as NULL.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return _dumps(value) if value else None
+
+    def process_result_value(self, value, dialect):
+        return _loads(value) if value else []
+
 
 class Base(DeclarativeBase):
     """Base class for all models."""
     pass
 
 
+@event.listens_for(Base.metadata, "after_create")
+def _enable_sqlite_pragmas(target, connection, **kw):
+    """
+    Tune the app's engine when database init runs create_all on it.
+
+    Registered on the engine that owns these tables rather than on the
+    Engine class, so engines the app does not own are left alone.
+    """
+    engine = connection.engine
+    if not event.contains(engine, "connect", _set_sqlite_pragmas):
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+        # The connection running create_all was opened before the listener
+        _set_sqlite_pragmas(connection.connection.dbapi_connection, None)
+
+
+@event.listens_for(Base, "init", propagate=True)
+def _default_string_lists(target, args, kwargs):
+    """Start list columns at [] so new instances match loaded rows."""
+    for column in target.__table__.columns:
+        if isinstance(column.type, StringList):
+            kwargs.setdefault(column.key, [])
+
+
 class Pipeline(Base):
     """A job application pipeline - one per company/role combination."""
     __tablename__ = "pipelines"
+    __table_args__ = (
+        Index("ix_pipelines_stage_priority", "current_stage", "priority"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     company: Mapped[str] = mapped_column(String(100), index=True)
@@ -41,10 +114,12 @@ class Pipeline(Base):
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     priority: Mapped[int] = mapped_column(Integer, default=Priority.MEDIUM.value)
 
-    # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # Timestamps - generated by SQLite (UTC) as part of the INSERT/UPDATE
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.current_timestamp()
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp()
     )
 
     # Relationships
@@ -59,23 +134,37 @@ class Pipeline(Base):
     @property
     def stage(self) -> PipelineStage:
         """Get the current stage as an enum."""
-        return PipelineStage(self.current_stage)
+        return _STAGES[self.current_stage]
 
     @stage.setter
     def stage(self, value: PipelineStage):
         """Set the current stage from an enum."""
         self.current_stage = value.value
 
-    @property
+    @hybrid_property
     def days_since_applied(self) -> int:
         """Days since the application was submitted."""
         return (date.today() - self.applied_date).days
 
-    @property
+    @days_since_applied.inplace.expression
+    @classmethod
+    def _days_since_applied_expression(cls):
+        """SQL form, so queries can select/filter on it without loading rows."""
+        return cast(
+            func.julianday(func.date("now", "localtime")) - func.julianday(cls.applied_date),
+            Integer,
+        )
+
+    @hybrid_property
     def days_since_update(self) -> int:
         """Days since the pipeline was last updated."""
         return (datetime.utcnow() - self.updated_at).days
 
+    @days_since_update.inplace.expression
+    @classmethod
+    def _days_since_update_expression(cls):
+        return cast(func.julianday("now") - func.julianday(cls.updated_at), Integer)
+
     def __repr__(self) -> str:
         return f"<Pipeline {self.id}: {self.company} - {self.role}>"
 
@@ -83,6 +172,15 @@ class Pipeline(Base):
 class Interview(Base):
     """Individual interview within a pipeline."""
     __tablename__ = "interviews"
+    __table_args__ = (
+        # Covers the dashboard's upcoming-interviews query: the pending rows in
+        # date order plus every column it reads, without visiting the table
+        Index(
+            "ix_interviews_upcoming",
+            "outcome", "scheduled_date", "pipeline_id", "stage", "prep_status",
+        ),
+        Index("ix_interviews_pipeline_date", "pipeline_id", "scheduled_date"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     pipeline_id: Mapped[int] = mapped_column(ForeignKey("pipelines.id"))
@@ -90,7 +188,7 @@ class Interview(Base):
     # Interview details
     stage: Mapped[str] = mapped_column(String(50))
     round_number: Mapped[int] = mapped_column(Integer, default=1)
-    scheduled_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    scheduled_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, index=True)
     duration_minutes: Mapped[int] = mapped_column(Integer, default=60)
     mode: Mapped[str] = mapped_column(String(20), default=InterviewMode.VIDEO.value)
     meeting_link: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
@@ -100,9 +198,9 @@ class Interview(Base):
     interviewer_title: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
     interviewer_linkedin: Mapped[Optional[str]] = mapped_column(String(300), nullable=True)
 
-    # Preparation - stored as JSON strings
-    _topics: Mapped[Optional[str]] = mapped_column("topics", Text, nullable=True)
-    _projects_to_pitch: Mapped[Optional[str]] = mapped_column("projects_to_pitch", Text, nullable=True)
+    # Preparation - list columns stored as JSON arrays
+    topics: Mapped[List[str]] = mapped_column(StringList, nullable=True)
+    projects_to_pitch: Mapped[List[str]] = mapped_column(StringList, nullable=True)
     prep_status: Mapped[str] = mapped_column(String(20), default=PrepStatus.NOT_STARTED.value)
     confidence: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     prep_notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -114,11 +212,13 @@ class Interview(Base):
 
     # Follow-up
     next_actions: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    follow_up_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    follow_up_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True, index=True)
     thank_you_sent: Mapped[bool] = mapped_column(Boolean, default=False)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.current_timestamp()
+    )
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Relationships
@@ -127,49 +227,25 @@ class Interview(Base):
         back_populates="interview", cascade="all, delete-orphan"
     )
 
-    @property
-    def topics(self) -> List[str]:
-        """Get topics as a list."""
-        if self._topics:
-            return json.loads(self._topics)
-        return []
-
-    @topics.setter
-    def topics(self, value: List[str]):
-        """Set topics from a list."""
-        self._topics = json.dumps(value) if value else None
-
-    @property
-    def projects_to_pitch(self) -> List[str]:
-        """Get projects as a list."""
-        if self._projects_to_pitch:
-            return json.loads(self._projects_to_pitch)
-        return []
-
-    @projects_to_pitch.setter
-    def projects_to_pitch(self, value: List[str]):
-        """Set projects from a list."""
-        self._projects_to_pitch = json.dumps(value) if value else None
-
     @property
     def interview_stage(self) -> PipelineStage:
         """Get stage as enum."""
-        return PipelineStage(self.stage)
+        return _STAGES[self.stage]
 
     @property
     def interview_mode(self) -> InterviewMode:
         """Get mode as enum."""
-        return InterviewMode(self.mode)
+        return _MODES[self.mode]
 
     @property
     def interview_outcome(self) -> InterviewOutcome:
         """Get outcome as enum."""
-        return InterviewOutcome(self.outcome)
+        return _OUTCOMES[self.outcome]
 
     @property
     def preparation_status(self) -> PrepStatus:
         """Get prep status as enum."""
-        return PrepStatus(self.prep_status)
+        return _PREP_STATUSES[self.prep_status]
 
     @property
     def is_upcoming(self) -> bool:
@@ -204,7 +280,9 @@ class Contact(Base):
     linkedin: Mapped[Optional[str]] = mapped_column(String(300), nullable=True)
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.current_timestamp()
+    )
 
     pipeline: Mapped["Pipeline"] = relationship(back_populates="contacts")
 
@@ -230,28 +308,18 @@ class InterviewQuestion(Base):
     rating: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     gap_identified: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     action_item: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    _tags: Mapped[Optional[str]] = mapped_column("tags", Text, nullable=True)
+    tags: Mapped[List[str]] = mapped_column(StringList, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.current_timestamp()
+    )
 
     interview: Mapped[Optional["Interview"]] = relationship(back_populates="questions")
 
-    @property
-    def tags(self) -> List[str]:
-        """Get tags as a list."""
-        if self._tags:
-            return json.loads(self._tags)
-        return []
-
-    @tags.setter
-    def tags(self, value: List[str]):
-        """Set tags from a list."""
-        self._tags = json.dumps(value) if value else None
-
     @property
     def type(self) -> QuestionType:
         """Get question type as enum."""
-        return QuestionType(self.question_type)
+        return _QUESTION_TYPES[self.question_type]
 
     def __repr__(self) -> str:
         return f"<Question {self.id}: {self.question_text[:50]}...>"
@@ -264,37 +332,19 @@ class PrepTopic(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     category: Mapped[str] = mapped_column(String(50))
     topic: Mapped[str] = mapped_column(String(200))
-    _subtopics: Mapped[Optional[str]] = mapped_column("subtopics", Text, nullable=True)
-    _resources: Mapped[Optional[str]] = mapped_column("resources", Text, nullable=True)
+    subtopics: Mapped[List[str]] = mapped_column(StringList, nullable=True)
+    resources: Mapped[List[str]] = mapped_column(StringList, nullable=True)
     confidence_level: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     last_reviewed: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
     review_notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-
-    @property
-    def subtopics(self) -> List[str]:
-        if self._subtopics:
-            return json.loads(self._subtopics)
-        return []
-
-    @subtopics.setter
-    def subtopics(self, value: List[str]):
-        self._subtopics = json.dumps(value) if value else None
-
-    @property
-    def resources(self) -> List[str]:
-        if self._resources:
-            return json.loads(self._resources)
-        return []
-
-    @resources.setter
-    def resources(self, value: List[str]):
-        self._resources = json.dumps(value) if value else None
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.current_timestamp()
+    )
 
     @property
     def prep_category(self) -> PrepCategory:
-        return PrepCategory(self.category)
+        return _PREP_CATEGORIES[self.category]
 
     def __repr__(self) -> str:
         return f"<PrepTopic {self.id}: {self.topic}>"
@@ -307,34 +357,16 @@ class Project(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(200))
     description: Mapped[str] = mapped_column(Text)
-    _technologies: Mapped[Optional[str]] = mapped_column("technologies", Text, nullable=True)
+    technologies: Mapped[List[str]] = mapped_column(StringList, nullable=True)
     impact_metrics: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     challenges_overcome: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     lessons_learned: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    _best_for_stages: Mapped[Optional[str]] = mapped_column("best_for_stages", Text, nullable=True)
+    best_for_stages: Mapped[List[str]] = mapped_column(StringList, nullable=True)
     pitch_duration: Mapped[str] = mapped_column(String(20), default="2 min")
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-
-    @property
-    def technologies(self) -> List[str]:
-        if self._technologies:
-            return json.loads(self._technologies)
-        return []
-
-    @technologies.setter
-    def technologies(self, value: List[str]):
-        self._technologies = json.dumps(value) if value else None
-
-    @property
-    def best_for_stages(self) -> List[str]:
-        if self._best_for_stages:
-            return json.loads(self._best_for_stages)
-        return []
-
-    @best_for_stages.setter
-    def best_for_stages(self, value: List[str]):
-        self._best_for_stages = json.dumps(value) if value else None
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.current_timestamp()
+    )
 
     def __repr__(self) -> str:
         return f"<Project {self.id}: {self.name}>"
@@ -348,21 +380,33 @@ class QuestionsToAsk(Base):
     interview_type: Mapped[str] = mapped_column(String(50))
     question: Mapped[str] = mapped_column(Text)
     why_ask: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    _follow_ups: Mapped[Optional[str]] = mapped_column("follow_ups", Text, nullable=True)
+    follow_ups: Mapped[List[str]] = mapped_column(StringList, nullable=True)
     used_count: Mapped[int] = mapped_column(Integer, default=0)
     effectiveness_rating: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-
-    @property
-    def follow_ups(self) -> List[str]:
-        if self._follow_ups:
-            return json.loads(self._follow_ups)
-        return []
-
-    @follow_ups.setter
-    def follow_ups(self, value: List[str]):
-        self._follow_ups = json.dumps(value) if value else None
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.current_timestamp()
+    )
 
     def __repr__(self) -> str:
         return f"<QuestionsToAsk {self.id}: {self.question[:50]}...>"
+
+
+# Indexes earlier versions created that no current model declares
+_RETIRED_INDEXES = ("ix_interviews_outcome_date",)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _ensure_indexes(target, connection, **kw):
+    """
+    Bring an existing database's indexes in line with the models.
+
+    create_all only creates indexes together with their tables, so a
+    database made by an older version would never gain indexes added
+    since. This runs at the end of every create_all, on its connection.
+    """
+    for name in _RETIRED_INDEXES:
+        connection.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+    for table in target.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
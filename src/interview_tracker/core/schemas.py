@@ -46,7 +46,7 @@ class PipelineRead(BaseModel):
     company: str
     role: str
     job_url: Optional[str]
-    current_stage: str
+    current_stage: PipelineStage
     applied_date: date
     salary_range: Optional[str]
     location: Optional[str]
@@ -59,7 +59,7 @@ class PipelineRead(BaseModel):
     @computed_field
     @property
     def stage(self) -> PipelineStage:
-        return PipelineStage(self.current_stage)
+        return self.current_stage
 
     @computed_field
     @property
@@ -123,19 +123,19 @@ class InterviewRead(BaseModel):
     """Schema for reading an interview."""
     id: int
     pipeline_id: int
-    stage: str
+    stage: PipelineStage
     round_number: int
     scheduled_date: Optional[datetime]
     duration_minutes: int
-    mode: str
+    mode: InterviewMode
     meeting_link: Optional[str]
     interviewer_name: Optional[str]
     interviewer_title: Optional[str]
     interviewer_linkedin: Optional[str]
-    prep_status: str
+    prep_status: PrepStatus
     confidence: Optional[int]
     prep_notes: Optional[str]
-    outcome: str
+    outcome: InterviewOutcome
     feedback_received: Optional[str]
     self_assessment: Optional[str]
     next_actions: Optional[str]
@@ -147,22 +147,22 @@ class InterviewRead(BaseModel):
     @computed_field
     @property
     def interview_stage(self) -> PipelineStage:
-        return PipelineStage(self.stage)
+        return self.stage
 
     @computed_field
     @property
     def interview_mode(self) -> InterviewMode:
-        return InterviewMode(self.mode)
+        return self.mode
 
     @computed_field
     @property
     def interview_outcome(self) -> InterviewOutcome:
-        return InterviewOutcome(self.outcome)
+        return self.outcome
 
     @computed_field
     @property
     def preparation_status(self) -> PrepStatus:
-        return PrepStatus(self.prep_status)
+        return self.prep_status
 
     @computed_field
     @property
@@ -290,15 +290,15 @@ class UpcomingInterview(BaseModel):
     id: int
     company: str
     role: str
-    stage: str
+    stage: PipelineStage
     scheduled_date: datetime
-    prep_status: str
+    prep_status: PrepStatus
     days_until: int
 
     @computed_field
     @property
     def prep_status_enum(self) -> PrepStatus:
-        return PrepStatus(self.prep_status)
+        return self.prep_status
 
 
 class PipelineAttention(BaseModel):
@@ -306,7 +306,14 @@ class PipelineAttention(BaseModel):
     id: int
     company: str
     role: str
-    current_stage: str
+    current_stage: PipelineStage
     health: PipelineHealth
     days_since_update: int
     reason: str
+
+
+class DashboardSnapshot(BaseModel):
+    """Everything the dashboard shows, loaded together."""
+    metrics: DashboardMetrics
+    upcoming: List[UpcomingInterview]
+    attention: List[PipelineAttention]
@@ -1,108 +1,218 @@
 """Pipeline state machine for managing valid transitions."""
 
-from typing import Set, Dict, Optional
+from functools import lru_cache
+from typing import FrozenSet, Dict, Optional
 
 from .enums import PipelineStage
 
+_EMPTY: FrozenSet[PipelineStage] = frozenset()
+_TERMINAL = frozenset({
+    PipelineStage.REJECTED,
+    PipelineStage.DROPPED,
+    PipelineStage.OFFER,
+})
+_NEGATIVE_TERMINAL = frozenset({PipelineStage.REJECTED, PipelineStage.DROPPED})
+
+
+# Define valid transitions: current_state -> set of valid next states
+TRANSITIONS: Dict[PipelineStage, FrozenSet[PipelineStage]] = {
+    PipelineStage.APPLIED: frozenset({
+        PipelineStage.RECRUITER_SCREEN,
+        PipelineStage.TECH_ROUND_1,  # Some skip recruiter
+        PipelineStage.REJECTED,
+        PipelineStage.DROPPED,
+    }),
+    PipelineStage.RECRUITER_SCREEN: frozenset({
+        PipelineStage.TECH_ROUND_1,
+        PipelineStage.REJECTED,
+        PipelineStage.DROPPED,
+    }),
+    PipelineStage.TECH_ROUND_1: frozenset({
+        PipelineStage.TECH_ROUND_2,
+        PipelineStage.SYSTEM_DESIGN,
+        PipelineStage.AI_ROUND,
+        PipelineStage.HM_ROUND,
+        PipelineStage.REJECTED,
+        PipelineStage.DROPPED,
+    }),
+    PipelineStage.TECH_ROUND_2: frozenset({
+        PipelineStage.SYSTEM_DESIGN,
+        PipelineStage.AI_ROUND,
+        PipelineStage.HM_ROUND,
+        PipelineStage.FINAL_CULTURE,
+        PipelineStage.REJECTED,
+        PipelineStage.DROPPED,
+    }),
+    PipelineStage.SYSTEM_DESIGN: frozenset({
+        PipelineStage.AI_ROUND,
+        PipelineStage.HM_ROUND,
+        PipelineStage.FINAL_CULTURE,
+        PipelineStage.OFFER,
+        PipelineStage.REJECTED,
+        PipelineStage.DROPPED,
+    }),
+    PipelineStage.AI_ROUND: frozenset({
+        PipelineStage.HM_ROUND,
+        PipelineStage.FINAL_CULTURE,
+        PipelineStage.OFFER,
+        PipelineStage.REJECTED,
+        PipelineStage.DROPPED,
+    }),
+    PipelineStage.HM_ROUND: frozenset({
+        PipelineStage.FINAL_CULTURE,
+        PipelineStage.OFFER,
+        PipelineStage.REJECTED,
+        PipelineStage.DROPPED,
+    }),
+    PipelineStage.FINAL_CULTURE: frozenset({
+        PipelineStage.OFFER,
+        PipelineStage.REJECTED,
+        PipelineStage.DROPPED,
+    }),
+    PipelineStage.OFFER: frozenset({
+        PipelineStage.DROPPED,  # Can decline offer
+    }),
+    PipelineStage.REJECTED: _EMPTY,  # Terminal state
+    PipelineStage.DROPPED: _EMPTY,  # Terminal state
+}
+
+# Define stage order for progression tracking
+STAGE_ORDER: Dict[PipelineStage, int] = {
+    PipelineStage.APPLIED: 0,
+    PipelineStage.RECRUITER_SCREEN: 1,
+    PipelineStage.TECH_ROUND_1: 2,
+    PipelineStage.TECH_ROUND_2: 3,
+    PipelineStage.SYSTEM_DESIGN: 4,
+    PipelineStage.AI_ROUND: 4,  # Same level as system design
+    PipelineStage.HM_ROUND: 5,
+    PipelineStage.FINAL_CULTURE: 6,
+    PipelineStage.OFFER: 7,
+    PipelineStage.REJECTED: -1,  # Terminal
+    PipelineStage.DROPPED: -1,  # Terminal
+}
+
+_MAX_ORDER = STAGE_ORDER[PipelineStage.OFFER]
+
+# Progress percentage per stage: negative terminals are 0, an offer is 100
+_PROGRESS_PCT: Dict[PipelineStage, int] = {
+    stage: (
+        0 if stage in _NEGATIVE_TERMINAL
+        else 100 if stage == PipelineStage.OFFER
+        else int((order / _MAX_ORDER) * 100) if _MAX_ORDER
+        else 0
+    )
+    for stage, order in STAGE_ORDER.items()
+}
+
+# Every (from, to) pair that counts as forward progress
+_PROGRESSES = frozenset(
+    (a, b)
+    for a in PipelineStage
+    for b in PipelineStage
+    if b not in _NEGATIVE_TERMINAL and STAGE_ORDER.get(b, 0) > STAGE_ORDER.get(a, 0)
+)
+
+# "Valid options" text for each source stage, listed in declaration order
+_VALID_OPTIONS: Dict[PipelineStage, str] = {
+    stage: ", ".join(s.display_name for s in PipelineStage if s in targets)
+    for stage, targets in TRANSITIONS.items()
+}
+
+
+# The helpers below are pure functions of their stage arguments. The ones
+# that compute something are memoized; the stage space is small enough
+# that the caches stay bounded.
+
+def can_transition(from_stage: PipelineStage, to_stage: PipelineStage) -> bool:
+    """Check if a transition from one stage to another is valid."""
+    return to_stage in TRANSITIONS.get(from_stage, _EMPTY)
+
+
+def get_valid_transitions(current_stage: PipelineStage) -> FrozenSet[PipelineStage]:
+    """Get all valid next stages from the current stage."""
+    return TRANSITIONS.get(current_stage, _EMPTY)
+
+
+def is_terminal(stage: PipelineStage) -> bool:
+    """Check if a stage is terminal (no further transitions possible)."""
+    return stage in _TERMINAL
+
+
+def is_negative_terminal(stage: PipelineStage) -> bool:
+    """Check if the stage is a negative outcome."""
+    return stage in _NEGATIVE_TERMINAL
+
+
+def get_stage_order(stage: PipelineStage) -> int:
+    """Get the ordinal position of a stage (for sorting/progress)."""
+    return STAGE_ORDER.get(stage, 0)
+
+
+def is_progressing(from_stage: PipelineStage, to_stage: PipelineStage) -> bool:
+    """Check if the transition represents forward progress."""
+    return (from_stage, to_stage) in _PROGRESSES
+
+
+def get_progress_percentage(stage: PipelineStage) -> int:
+    """Get the progress percentage for a stage (0-100)."""
+    return _PROGRESS_PCT.get(stage, 0)
+
+
+@lru_cache(maxsize=256)
+def get_next_logical_stages(current_stage: PipelineStage) -> FrozenSet[PipelineStage]:
+    """
+    Get the most likely next stages (excluding terminal states).
+    Useful for UI suggestions.
+    """
+    return get_valid_transitions(current_stage) - _NEGATIVE_TERMINAL
+
+
+@lru_cache(maxsize=256)
+def validate_transition(
+    from_stage: PipelineStage, to_stage: PipelineStage
+) -> tuple[bool, Optional[str]]:
+    """
+    Validate a transition and return a tuple of (is_valid, error_message).
+    """
+    if from_stage == to_stage:
+        return False, "Cannot transition to the same stage"
+
+    if is_terminal(from_stage) and from_stage != PipelineStage.OFFER:
+        return False, f"Cannot transition from terminal stage: {from_stage.display_name}"
+
+    if not can_transition(from_stage, to_stage):
+        return False, (
+            f"Invalid transition from {from_stage.display_name} to {to_stage.display_name}. "
+            f"Valid options: {_VALID_OPTIONS.get(from_stage, '')}"
+        )
+
+    return True, None
+
 
 class PipelineStateMachine:
-    """Manages valid state transitions for interview pipelines."""
-
-    # Define valid transitions: current_state -> set of valid next states
-    TRANSITIONS: Dict[PipelineStage, Set[PipelineStage]] = {
-        PipelineStage.APPLIED: {
-            PipelineStage.RECRUITER_SCREEN,
-            PipelineStage.TECH_ROUND_1,  # Some skip recruiter
-            PipelineStage.REJECTED,
-            PipelineStage.DROPPED,
-        },
-        PipelineStage.RECRUITER_SCREEN: {
-            PipelineStage.TECH_ROUND_1,
-            PipelineStage.REJECTED,
-            PipelineStage.DROPPED,
-        },
-        PipelineStage.TECH_ROUND_1: {
-            PipelineStage.TECH_ROUND_2,
-            PipelineStage.SYSTEM_DESIGN,
-            PipelineStage.AI_ROUND,
-            PipelineStage.HM_ROUND,
-            PipelineStage.REJECTED,
-            PipelineStage.DROPPED,
-        },
-        PipelineStage.TECH_ROUND_2: {
-            PipelineStage.SYSTEM_DESIGN,
-            PipelineStage.AI_ROUND,
-            PipelineStage.HM_ROUND,
-            PipelineStage.FINAL_CULTURE,
-            PipelineStage.REJECTED,
-            PipelineStage.DROPPED,
-        },
-        PipelineStage.SYSTEM_DESIGN: {
-            PipelineStage.AI_ROUND,
-            PipelineStage.HM_ROUND,
-            PipelineStage.FINAL_CULTURE,
-            PipelineStage.OFFER,
-            PipelineStage.REJECTED,
-            PipelineStage.DROPPED,
-        },
-        PipelineStage.AI_ROUND: {
-            PipelineStage.HM_ROUND,
-            PipelineStage.FINAL_CULTURE,
-            PipelineStage.OFFER,
-            PipelineStage.REJECTED,
-            PipelineStage.DROPPED,
-        },
-        PipelineStage.HM_ROUND: {
-            PipelineStage.FINAL_CULTURE,
-            PipelineStage.OFFER,
-            PipelineStage.REJECTED,
-            PipelineStage.DROPPED,
-        },
-        PipelineStage.FINAL_CULTURE: {
-            PipelineStage.OFFER,
-            PipelineStage.REJECTED,
-            PipelineStage.DROPPED,
-        },
-        PipelineStage.OFFER: {
-            PipelineStage.DROPPED,  # Can decline offer
-        },
-        PipelineStage.REJECTED: set(),  # Terminal state
-        PipelineStage.DROPPED: set(),  # Terminal state
-    }
-
-    # Define stage order for progression tracking
-    STAGE_ORDER: Dict[PipelineStage, int] = {
-        PipelineStage.APPLIED: 0,
-        PipelineStage.RECRUITER_SCREEN: 1,
-        PipelineStage.TECH_ROUND_1: 2,
-        PipelineStage.TECH_ROUND_2: 3,
-        PipelineStage.SYSTEM_DESIGN: 4,
-        PipelineStage.AI_ROUND: 4,  # Same level as system design
-        PipelineStage.HM_ROUND: 5,
-        PipelineStage.FINAL_CULTURE: 6,
-        PipelineStage.OFFER: 7,
-        PipelineStage.REJECTED: -1,  # Terminal
-        PipelineStage.DROPPED: -1,  # Terminal
-    }
+    """
+    Manages valid state transitions for interview pipelines.
+
+    Thin wrapper over the module-level functions, kept for existing callers.
+    """
+
+    TRANSITIONS = TRANSITIONS
+    STAGE_ORDER = STAGE_ORDER
 
     @classmethod
     def can_transition(cls, from_stage: PipelineStage, to_stage: PipelineStage) -> bool:
         """Check if a transition from one stage to another is valid."""
-        return to_stage in cls.TRANSITIONS.get(from_stage, set())
+        return can_transition(from_stage, to_stage)
 
     @classmethod
-    def get_valid_transitions(cls, current_stage: PipelineStage) -> Set[PipelineStage]:
+    def get_valid_transitions(cls, current_stage: PipelineStage) -> FrozenSet[PipelineStage]:
         """Get all valid next stages from the current stage."""
-        return cls.TRANSITIONS.get(current_stage, set())
+        return get_valid_transitions(current_stage)
 
     @classmethod
     def is_terminal(cls, stage: PipelineStage) -> bool:
         """Check if a stage is terminal (no further transitions possible)."""
-        return stage in {
-            PipelineStage.REJECTED,
-            PipelineStage.DROPPED,
-            PipelineStage.OFFER,
-        }
+        return is_terminal(stage)
 
     @classmethod
     def is_positive_terminal(cls, stage: PipelineStage) -> bool:
@@ -112,45 +222,30 @@ class PipelineStateMachine:
     @classmethod
     def is_negative_terminal(cls, stage: PipelineStage) -> bool:
         """Check if the stage is a negative outcome."""
-        return stage in {PipelineStage.REJECTED, PipelineStage.DROPPED}
+        return is_negative_terminal(stage)
 
     @classmethod
     def get_stage_order(cls, stage: PipelineStage) -> int:
         """Get the ordinal position of a stage (for sorting/progress)."""
-        return cls.STAGE_ORDER.get(stage, 0)
+        return get_stage_order(stage)
 
     @classmethod
     def is_progressing(cls, from_stage: PipelineStage, to_stage: PipelineStage) -> bool:
         """Check if the transition represents forward progress."""
-        if cls.is_negative_terminal(to_stage):
-            return False
-        from_order = cls.get_stage_order(from_stage)
-        to_order = cls.get_stage_order(to_stage)
-        return to_order > from_order
+        return is_progressing(from_stage, to_stage)
 
     @classmethod
     def get_progress_percentage(cls, stage: PipelineStage) -> int:
         """Get the progress percentage for a stage (0-100)."""
-        if cls.is_negative_terminal(stage):
-            return 0
-        if stage == PipelineStage.OFFER:
-            return 100
-
-        order = cls.get_stage_order(stage)
-        max_order = cls.get_stage_order(PipelineStage.OFFER)
-
-        if max_order == 0:
-            return 0
-        return int((order / max_order) * 100)
+        return get_progress_percentage(stage)
 
     @classmethod
-    def get_next_logical_stages(cls, current_stage: PipelineStage) -> Set[PipelineStage]:
+    def get_next_logical_stages(cls, current_stage: PipelineStage) -> FrozenSet[PipelineStage]:
         """
         Get the most likely next stages (excluding terminal states).
         Useful for UI suggestions.
         """
-        valid = cls.get_valid_transitions(current_stage)
-        return {s for s in valid if not cls.is_negative_terminal(s)}
+        return get_next_logical_stages(current_stage)
 
     @classmethod
     def validate_transition(
@@ -159,20 +254,7 @@ class PipelineStateMachine:
         """
         Validate a transition and return a tuple of (is_valid, error_message).
         """
-        if from_stage == to_stage:
-            return False, "Cannot transition to the same stage"
-
-        if cls.is_terminal(from_stage) and from_stage != PipelineStage.OFFER:
-            return False, f"Cannot transition from terminal stage: {from_stage.display_name}"
-
-        if not cls.can_transition(from_stage, to_stage):
-            valid_stages = [s.display_name for s in cls.get_valid_transitions(from_stage)]
-            return False, (
-                f"Invalid transition from {from_stage.display_name} to {to_stage.display_name}. "
-                f"Valid options: {', '.join(valid_stages)}"
-            )
-
-        return True, None
+        return validate_transition(from_stage, to_stage)
 
 
 class TransitionError(Exception):
@@ -1,17 +1,14 @@
 """Main application window for Interview Tracker."""
 
 import customtkinter as ctk
-from typing import Optional
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
 
-from .theme import Colors, Fonts, Dimensions
+from .theme import Colors, Fonts, Dimensions, configure_theme
 from .components.sidebar import Sidebar
-from .views.dashboard import DashboardView
-from .views.pipelines import PipelineListView, PipelineDetailView
-from .views.interviews import InterviewListView, InterviewDetailView
-from .views.questions import QuestionBankView, QuestionDetailView
-from .forms.pipeline_form import PipelineFormDialog
-from .forms.interview_form import InterviewFormDialog
-from .forms.question_form import QuestionFormDialog
+
+# Number of detail views kept alive for reuse after navigating away
+VIEW_CACHE_SIZE = 8
 
 
 class InterviewTrackerApp(ctk.CTk):
@@ -31,10 +28,21 @@ class InterviewTrackerApp(ctk.CTk):
         # Current view tracking
         self._current_view: Optional[ctk.CTkFrame] = None
         self._view_stack: list = []
+        self._view_cache: "OrderedDict[Hashable, ctk.CTkFrame]" = OrderedDict()
+        self._refresh_pending = False
 
         # Create main layout
         self._create_layout()
 
+        # Sidebar view ids and the handlers that show them
+        self._nav_table = {
+            "dashboard": self._show_dashboard,
+            "pipelines": self._show_pipelines,
+            "interviews": self._show_interviews,
+            "questions": self._show_questions,
+            "settings": self._show_settings,
+        }
+
         # Show dashboard by default
         self._show_dashboard()
 
@@ -60,23 +68,19 @@ class InterviewTrackerApp(ctk.CTk):
     def _on_navigate(self, view_id: str):
         """Handle navigation from sidebar."""
         # Clear view stack when navigating via sidebar
+        stacked = self._view_stack[:]
         self._view_stack.clear()
+        for view in stacked:
+            self._discard_view(view)
 
-        if view_id == "dashboard":
-            self._show_dashboard()
-        elif view_id == "pipelines":
-            self._show_pipelines()
-        elif view_id == "interviews":
-            self._show_interviews()
-        elif view_id == "questions":
-            self._show_questions()
-        elif view_id == "settings":
-            self._show_settings()
+        handler = self._nav_table.get(view_id)
+        if handler:
+            handler()
 
     def _switch_view(self, new_view: ctk.CTkFrame):
         """Switch to a new view."""
         if self._current_view:
-            self._current_view.destroy()
+            self._discard_view(self._current_view)
 
         self._current_view = new_view
         self._current_view.grid(row=0, column=0, sticky="nsew")
@@ -94,7 +98,7 @@ class InterviewTrackerApp(ctk.CTk):
         """Pop back to the previous view."""
         if self._view_stack:
             if self._current_view:
-                self._current_view.destroy()
+                self._discard_view(self._current_view)
 
             self._current_view = self._view_stack.pop()
             self._current_view.grid(row=0, column=0, sticky="nsew")
@@ -103,12 +107,51 @@ class InterviewTrackerApp(ctk.CTk):
             if hasattr(self._current_view, 'refresh'):
                 self._current_view.refresh()
 
+    def _push_cached_view(self, key: Hashable, factory: Callable[[], ctk.CTkFrame]):
+        """
+        Push a detail view, reusing a hidden instance for the same key.
+
+        A reused view is refreshed rather than rebuilt. Views that are
+        currently visible or on the stack are never shared.
+        """
+        view = self._view_cache.get(key)
+        if view is not None and view is not self._current_view and view not in self._view_stack:
+            self._view_cache.move_to_end(key)
+            view.refresh()
+        else:
+            view = factory()
+            self._view_cache[key] = view
+            self._view_cache.move_to_end(key)
+            self._evict_views()
+
+        self._push_view(view)
+
+    def _discard_view(self, view: ctk.CTkFrame):
+        """Hide a view that is leaving the screen, destroying it unless cached."""
+        if any(cached is view for cached in self._view_cache.values()):
+            view.grid_forget()
+        else:
+            view.destroy()
+
+    def _evict_views(self, keep: int = VIEW_CACHE_SIZE):
+        """Destroy the least recently used hidden views beyond keep."""
+        in_use = [self._current_view, *self._view_stack]
+        for key in list(self._view_cache):
+            if len(self._view_cache) <= keep:
+                break
+            view = self._view_cache[key]
+            if any(view is v for v in in_use):
+                continue
+            del self._view_cache[key]
+            view.destroy()
+
     # =========================================================================
     # Dashboard
     # =========================================================================
 
     def _show_dashboard(self):
         """Show the dashboard view."""
+        from .views.dashboard import DashboardView
         view = DashboardView(
             self._content_frame,
             on_view_pipeline=self._show_pipeline_detail,
@@ -124,6 +167,7 @@ class InterviewTrackerApp(ctk.CTk):
 
     def _show_pipelines(self):
         """Show the pipelines list view."""
+        from .views.pipelines import PipelineListView
         view = PipelineListView(
             self._content_frame,
             on_view_pipeline=self._show_pipeline_detail,
@@ -133,17 +177,21 @@ class InterviewTrackerApp(ctk.CTk):
 
     def _show_pipeline_detail(self, pipeline_id: int):
         """Show pipeline detail view."""
-        view = PipelineDetailView(
-            self._content_frame,
-            pipeline_id=pipeline_id,
-            on_back=self._pop_view,
-            on_schedule_interview=lambda pid: self._show_schedule_interview_dialog(pid),
-            on_edit=self._show_edit_pipeline_dialog,
+        from .views.pipelines import PipelineDetailView
+        self._push_cached_view(
+            (PipelineDetailView, pipeline_id),
+            lambda: PipelineDetailView(
+                self._content_frame,
+                pipeline_id=pipeline_id,
+                on_back=self._pop_view,
+                on_schedule_interview=lambda pid: self._show_schedule_interview_dialog(pid),
+                on_edit=self._show_edit_pipeline_dialog,
+            ),
         )
-        self._push_view(view)
 
     def _show_add_pipeline_dialog(self):
         """Show dialog to add a new pipeline."""
+        from .forms.pipeline_form import PipelineFormDialog
         PipelineFormDialog(
             self,
             on_save=self._refresh_current_view,
@@ -151,6 +199,7 @@ class InterviewTrackerApp(ctk.CTk):
 
     def _show_edit_pipeline_dialog(self, pipeline_id: int):
         """Show dialog to edit a pipeline."""
+        from .forms.pipeline_form import PipelineFormDialog
         PipelineFormDialog(
             self,
             pipeline_id=pipeline_id,
@@ -163,6 +212,7 @@ class InterviewTrackerApp(ctk.CTk):
 
     def _show_interviews(self):
         """Show the interviews list view."""
+        from .views.interviews import InterviewListView
         view = InterviewListView(
             self._content_frame,
             on_view_interview=self._show_interview_detail,
@@ -172,17 +222,21 @@ class InterviewTrackerApp(ctk.CTk):
 
     def _show_interview_detail(self, interview_id: int):
         """Show interview detail view."""
-        view = InterviewDetailView(
-            self._content_frame,
-            interview_id=interview_id,
-            on_back=self._pop_view,
-            on_edit=self._show_edit_interview_dialog,
+        from .views.interviews import InterviewDetailView
+        self._push_cached_view(
+            (InterviewDetailView, interview_id),
+            lambda: InterviewDetailView(
+                self._content_frame,
+                interview_id=interview_id,
+                on_back=self._pop_view,
+                on_edit=self._show_edit_interview_dialog,
+            ),
         )
-        self._push_view(view)
 
     def _show_schedule_interview_dialog(self, pipeline_id: Optional[int] = None):
         """Show dialog to schedule a new interview."""
-        InterviewFormDialog(
+        from .forms.interview_form import InterviewFormDialog
+        InterviewFormDialog.open(
             self,
             pipeline_id=pipeline_id,
             on_save=self._refresh_current_view,
@@ -190,7 +244,8 @@ class InterviewTrackerApp(ctk.CTk):
 
     def _show_edit_interview_dialog(self, interview_id: int):
         """Show dialog to edit an interview."""
-        InterviewFormDialog(
+        from .forms.interview_form import InterviewFormDialog
+        InterviewFormDialog.open(
             self,
             interview_id=interview_id,
             on_save=self._refresh_current_view,
@@ -202,6 +257,7 @@ class InterviewTrackerApp(ctk.CTk):
 
     def _show_questions(self):
         """Show the question bank view."""
+        from .views.questions import QuestionBankView
         view = QuestionBankView(
             self._content_frame,
             on_add_question=self._show_add_question_dialog,
@@ -211,16 +267,20 @@ class InterviewTrackerApp(ctk.CTk):
 
     def _show_question_detail(self, question_id: int):
         """Show question detail view."""
-        view = QuestionDetailView(
-            self._content_frame,
-            question_id=question_id,
-            on_back=self._pop_view,
-            on_edit=self._show_edit_question_dialog,
+        from .views.questions import QuestionDetailView
+        self._push_cached_view(
+            (QuestionDetailView, question_id),
+            lambda: QuestionDetailView(
+                self._content_frame,
+                question_id=question_id,
+                on_back=self._pop_view,
+                on_edit=self._show_edit_question_dialog,
+            ),
         )
-        self._push_view(view)
 
     def _show_add_question_dialog(self):
         """Show dialog to add a new question."""
+        from .forms.question_form import QuestionFormDialog
         QuestionFormDialog(
             self,
             on_save=self._refresh_current_view,
@@ -228,6 +288,7 @@ class InterviewTrackerApp(ctk.CTk):
 
     def _show_edit_question_dialog(self, question_id: int):
         """Show dialog to edit a question."""
+        from .forms.question_form import QuestionFormDialog
         QuestionFormDialog(
             self,
             question_id=question_id,
@@ -249,12 +310,29 @@ class InterviewTrackerApp(ctk.CTk):
     # =========================================================================
 
     def _refresh_current_view(self):
+        """
+        Schedule a refresh of the current view.
+
+        Repeated requests before Tk goes idle collapse into one refresh.
+        """
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.after_idle(self._do_refresh_current_view)
+
+    def _do_refresh_current_view(self):
         """Refresh the current view if it supports it."""
+        self._refresh_pending = False
+
+        # A save may have changed what hidden views show; drop them
+        self._evict_views(keep=0)
+
         if self._current_view and hasattr(self._current_view, 'refresh'):
             self._current_view.refresh()
 
 
 def run_app():
     """Run the Interview Tracker application."""
+    configure_theme()
     app = InterviewTrackerApp()
     app.mainloop()
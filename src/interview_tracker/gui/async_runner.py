@@ -0,0 +1,60 @@
+"""Run database work off the Tk thread and hand results back to widgets."""
+
+import logging
+import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Shared by every view; two workers let one slow query not hold up the rest
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="db")
+
+
+def run_db(fn: Callable[..., Any], *args: Any) -> Future:
+    """
+    Run fn(*args) on a database worker thread.
+
+    fn must open its own session and return plain data, never ORM objects
+    bound to that session.
+    """
+    return _executor.submit(fn, *args)
+
+
+def call_when_done(
+    widget,
+    future: Future,
+    callback: Callable[[Any], None],
+    on_error: Optional[Callable[[BaseException], None]] = None,
+) -> None:
+    """
+    Call callback(result) on the Tk thread once future succeeds.
+
+    Skipped if the widget is destroyed first. Failures are logged, then
+    passed to on_error(exception) on the Tk thread when it is given.
+    """
+    def on_done(done: Future):
+        try:
+            widget.after(0, _deliver, widget, callback, on_error, done)
+        except (RuntimeError, tk.TclError):
+            pass  # Application already closed
+
+    future.add_done_callback(on_done)
+
+
+def _deliver(
+    widget,
+    callback: Callable[[Any], None],
+    on_error: Optional[Callable[[BaseException], None]],
+    future: Future,
+) -> None:
+    if not widget.winfo_exists():
+        return
+    try:
+        result = future.result()
+    except Exception as exc:
+        logger.exception("Background database task failed")
+        if on_error is not None:
+            on_error(exc)
+        return
+    callback(result)
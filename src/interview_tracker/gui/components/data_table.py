@@ -7,7 +7,27 @@ from ..theme import Colors, Fonts, Spacing, Dimensions
 
 
 class DataTable(ctk.CTkScrollableFrame):
-    """A scrollable table for displaying data."""
+    """
+    A scrollable table for displaying data.
+
+    Only the rows in view are backed by widgets. The table keeps a pool of
+    row frames sized to the viewport plus a few rows of overscan, and as
+    the view scrolls, rows that leave it are rebound to the data coming
+    into view by updating their cells in place. Empty grid rows above and
+    below the pool stand in for the rows without widgets, so the scrollbar
+    still spans the full data set.
+    """
+
+    # Every data row has this fixed height, so row positions can be computed
+    ROW_HEIGHT = 42
+    # Rows kept bound beyond those in view, split above and below
+    OVERSCAN = 6
+
+    _ANCHOR_MAP = {"left": "w", "center": "center", "right": "e"}
+
+    # Grid rows: the header, the spacer above the pool, then the pool
+    _TOP_SPACER_ROW = 1
+    _FIRST_POOL_ROW = 2
 
     def __init__(
         self,
@@ -27,6 +47,8 @@ class DataTable(ctk.CTkScrollableFrame):
                 - width: Column width (optional)
                 - align: Text alignment ('left', 'center', 'right')
                 - render: Custom render function (optional)
+                - badge: Function mapping a value to a (text, color)
+                  StatusBadge; badges are updated in place (optional)
             on_row_click: Callback for single click
             on_row_double_click: Callback for double click
         """
@@ -38,108 +60,296 @@ class DataTable(ctk.CTkScrollableFrame):
         )
 
         self._columns = columns
+        # Per-column (key, width, anchor, render, badge) resolved once for _create_cell
+        self._col_meta = [
+            (
+                c["key"], c.get("width", 150), self._get_anchor(c.get("align", "left")),
+                c.get("render"), c.get("badge"),
+            )
+            for c in columns
+        ]
+        self._cell_font = Fonts.get("normal")
         self._on_row_click = on_row_click
         self._on_row_double_click = on_row_double_click
         self._data: List[Dict] = []
-        self._row_frames: List[ctk.CTkFrame] = []
         self._selected_row: Optional[int] = None
-
+        # Every row frame created so far, and the ones showing data by index
+        self._pool: List[ctk.CTkFrame] = []
+        self._bound: Dict[int, ctk.CTkFrame] = {}
+        # First bound data index, and the grid row of the spacer below the pool
+        self._start = 0
+        self._bottom_spacer_row = self._FIRST_POOL_ROW
+
+        # Rebind rows as the view scrolls or resizes
+        self._parent_canvas.configure(yscrollcommand=self._on_canvas_scroll)
+        self._parent_canvas.bind("<Configure>", self._on_canvas_resize, add="+")
+
+        # Header, spacers and rows share a single stretching column
+        self.grid_columnconfigure(0, weight=1)
         self._create_header()
 
     def _create_header(self):
         """Create the table header."""
-        header_frame = ctk.CTkFrame(
+        self._header = ctk.CTkFrame(
             self,
             fg_color=Colors.BG_MEDIUM,
             corner_radius=0,
         )
-        header_frame.pack(fill="x", pady=(0, 1))
-
-        for col in self._columns:
-            width = col.get("width", 150)
-            align = col.get("align", "left")
+        self._header.grid(row=0, column=0, sticky="ew", pady=(0, 1))
 
+        for col_idx, (col, (_, width, anchor, _, _)) in enumerate(zip(self._columns, self._col_meta)):
             label = ctk.CTkLabel(
-                header_frame,
+                self._header,
                 text=col["title"],
                 font=Fonts.get("normal", "bold"),
                 text_color=Colors.TEXT_SECONDARY,
                 width=width,
-                anchor=self._get_anchor(align),
+                anchor=anchor,
             )
-            label.pack(side="left", padx=Spacing.PADDING_SMALL, pady=Spacing.PADDING_SMALL)
+            label.grid(row=0, column=col_idx, padx=Spacing.PADDING_SMALL, pady=Spacing.PADDING_SMALL)
 
     def _get_anchor(self, align: str) -> str:
         """Convert alignment to anchor."""
-        return {"left": "w", "center": "center", "right": "e"}.get(align, "w")
+        return self._ANCHOR_MAP.get(align, "w")
 
     def set_data(self, data: List[Dict]):
         """Set the table data."""
-        # Clear existing rows
-        for frame in self._row_frames:
-            frame.destroy()
-        self._row_frames.clear()
+        self._clear_selection()
         self._data = data
-        self._selected_row = None
+        self._render_window()
+
+    def apply_diff(self, data: List[Dict]):
+        """
+        Replace the table data, skipping the work when nothing changed.
 
-        # Create new rows
-        for idx, row_data in enumerate(data):
-            self._create_row(idx, row_data)
+        Rows in view keep their widgets; only cells whose values differ
+        are updated.
+        """
+        if data == self._data:
+            return
+        self.set_data(data)
+
+    def _row_stride(self) -> int:
+        """Height in pixels of one data row plus its separator."""
+        return round(self._apply_widget_scaling(self.ROW_HEIGHT)) + round(self._apply_widget_scaling(1))
+
+    def _pool_size(self) -> int:
+        """Rows needed to fill the viewport, plus overscan."""
+        canvas = self._parent_canvas
+        # Before the first layout the canvas only knows its requested height
+        viewport = max(canvas.winfo_height(), canvas.winfo_reqheight())
+        return -(-viewport // self._row_stride()) + self.OVERSCAN
+
+    def _first_visible(self) -> int:
+        """Index of the data row at the top of the view."""
+        header_bottom = self._header.winfo_y() + self._header.winfo_height() + 1
+        top = self._parent_canvas.canvasy(0) - header_bottom
+        return max(0, int(top // self._row_stride()))
+
+    def _window(self) -> tuple[int, int]:
+        """The (start, stop) range of data rows that should be bound."""
+        total = len(self._data)
+        count = min(self._pool_size(), total)
+        start = min(max(0, self._first_visible() - self.OVERSCAN // 2), total - count)
+        return start, start + count
+
+    def _render_window(self):
+        """Bind pool rows to the data in view and size the spacers around them."""
+        start, stop = self._window()
+
+        # Rows still in view keep their frame; the rest are rebound
+        old = self._bound
+        free = [frame for idx, frame in old.items() if not start <= idx < stop]
+        free.extend(frame for frame in self._pool if frame.row_index is None)
+
+        bound = {}
+        for idx in range(start, stop):
+            frame = old.get(idx)
+            if frame is None and free:
+                frame = free.pop()
+            if frame is None:
+                frame = self._create_row(idx, self._data[idx])
+                self._pool.append(frame)
+            else:
+                self._bind_row(frame, idx)
+            bound[idx] = frame
+
+            slot = self._FIRST_POOL_ROW + idx - start
+            if frame.grid_slot != slot:
+                frame.grid_slot = slot
+                frame.grid(row=slot, column=0, sticky="ew", pady=(0, 1))
+
+        for frame in free:
+            frame.row_index = None
+            frame.grid_slot = None
+            frame.grid_remove()
+
+        self._bound = bound
+        self._start = start
+
+        # Empty rows with a minimum size stand in for the unbound data
+        stride = self._row_stride()
+        self.grid_rowconfigure(self._TOP_SPACER_ROW, minsize=start * stride)
+        self.grid_rowconfigure(self._bottom_spacer_row, minsize=0)
+        self._bottom_spacer_row = self._FIRST_POOL_ROW + stop - start
+        self.grid_rowconfigure(
+            self._bottom_spacer_row, minsize=(len(self._data) - stop) * stride
+        )
 
-    def _create_row(self, index: int, row_data: Dict):
-        """Create a single data row."""
-        bg_color = Colors.BG_CARD if index % 2 == 0 else Colors.BG_LIGHT
+    def _on_canvas_scroll(self, first: str, last: str):
+        """Forward the scroll position and rebind rows once the view moves."""
+        self._scrollbar.set(first, last)
+
+        if self._data and self._window() != (self._start, self._start + len(self._bound)):
+            self._render_window()
+
+    def _on_canvas_resize(self, event):
+        """Grow or shrink the bound rows to the new viewport height."""
+        if self._data and self._window() != (self._start, self._start + len(self._bound)):
+            self._render_window()
+
+    def _create_row(self, index: int, row_data: Dict) -> ctk.CTkFrame:
+        """Create a single data row, leaving it to the caller to place."""
+        bg_color = self._row_color(index)
 
         row_frame = ctk.CTkFrame(
             self,
             fg_color=bg_color,
             corner_radius=0,
+            height=self.ROW_HEIGHT,
         )
-        row_frame.pack(fill="x", pady=(0, 1))
+        # Hold the fixed height whatever the cells ask for; see _row_stride
+        row_frame.grid_propagate(False)
+        row_frame.grid_rowconfigure(0, weight=1)
+
+        # Cells find their row through this attribute; see _row_index_of
+        row_frame.row_index = index
+        # The data the cells currently show, diffed against on rebind
+        row_frame.row_data = row_data
+        # The background shown, so rebinding skips recoloring when it matches
+        row_frame.base_color = bg_color
+        # Grid row the frame sits in, or None while it is unused
+        row_frame.grid_slot = None
 
         # Bind click events
-        row_frame.bind("<Button-1>", lambda e, i=index: self._on_click(i))
-        row_frame.bind("<Double-Button-1>", lambda e, i=index: self._on_double_click(i))
+        row_frame.bind("<Button-1>", self._on_cell_click)
+        row_frame.bind("<Double-Button-1>", self._on_cell_double_click)
+
+        # One widget (or None) per column, kept for _update_cells
+        row_frame.cells = [
+            self._create_cell(row_frame, col_idx, row_data)
+            for col_idx in range(len(self._col_meta))
+        ]
+
+        return row_frame
+
+    def _create_cell(self, row_frame: ctk.CTkFrame, col_idx: int, row_data: Dict):
+        """Create and place the widget for one cell of a row."""
+        key, width, anchor, render, badge = self._col_meta[col_idx]
+        value = row_data.get(key, "")
+
+        if badge is not None:
+            text, color = badge(value)
+            widget = StatusBadge(row_frame, text=text, color=color)
+        elif render is not None:
+            widget = render(row_frame, value, row_data)
+            if not widget:
+                return None
+        else:
+            widget = ctk.CTkLabel(
+                row_frame,
+                text=str(value),
+                font=self._cell_font,
+                text_color=Colors.TEXT_PRIMARY,
+                width=width,
+                anchor=anchor,
+            )
 
-        for col in self._columns:
-            width = col.get("width", 150)
-            align = col.get("align", "left")
-            key = col["key"]
+        pad = Spacing.PADDING_SMALL
+        widget.grid(row=0, column=col_idx, padx=pad, pady=pad)
+        widget.bind("<Button-1>", self._on_cell_click)
+        widget.bind("<Double-Button-1>", self._on_cell_double_click)
+        return widget
+
+    def _update_cells(self, row_frame: ctk.CTkFrame, old_data: Dict, row_data: Dict):
+        """Show new data in an existing row, touching only cells that changed."""
+        if old_data == row_data:
+            return
+
+        cells = row_frame.cells
+        for col_idx, (key, _, _, render, badge) in enumerate(self._col_meta):
+            if render is not None and badge is None:
+                # Custom widgets may read any field, so always re-render them
+                if cells[col_idx] is not None:
+                    cells[col_idx].destroy()
+                cells[col_idx] = self._create_cell(row_frame, col_idx, row_data)
+                continue
 
-            # Get the value
             value = row_data.get(key, "")
-
-            # Apply custom render if provided
-            if "render" in col:
-                widget = col["render"](row_frame, value, row_data)
-                if widget:
-                    widget.pack(side="left", padx=Spacing.PADDING_SMALL, pady=Spacing.PADDING_SMALL)
-                    widget.bind("<Button-1>", lambda e, i=index: self._on_click(i))
-                    widget.bind("<Double-Button-1>", lambda e, i=index: self._on_double_click(i))
+            if value == old_data.get(key, ""):
+                continue
+            if badge is not None:
+                cells[col_idx].set(*badge(value))
             else:
-                label = ctk.CTkLabel(
-                    row_frame,
-                    text=str(value),
-                    font=Fonts.get("normal"),
-                    text_color=Colors.TEXT_PRIMARY,
-                    width=width,
-                    anchor=self._get_anchor(align),
-                )
-                label.pack(side="left", padx=Spacing.PADDING_SMALL, pady=Spacing.PADDING_SMALL)
-                label.bind("<Button-1>", lambda e, i=index: self._on_click(i))
-                label.bind("<Double-Button-1>", lambda e, i=index: self._on_double_click(i))
-
-        self._row_frames.append(row_frame)
+                cells[col_idx].configure(text=str(value))
+
+    def _row_color(self, index: int) -> str:
+        """Background for a data row: the selection highlight or its stripe."""
+        if index == self._selected_row:
+            return Colors.PRIMARY_HOVER
+        return Colors.BG_CARD if index % 2 == 0 else Colors.BG_LIGHT
+
+    def _bind_row(self, row_frame: ctk.CTkFrame, index: int):
+        """Point a pooled row at a data row, updating only what differs."""
+        row_data = self._data[index]
+        self._update_cells(row_frame, row_frame.row_data, row_data)
+        row_frame.row_data = row_data
+        row_frame.row_index = index
+
+        bg_color = self._row_color(index)
+        if bg_color != row_frame.base_color:
+            row_frame.base_color = bg_color
+            row_frame.configure(fg_color=bg_color)
+
+    @staticmethod
+    def _row_index_of(widget) -> Optional[int]:
+        """Find the data row index for a widget inside a row frame."""
+        while widget is not None:
+            index = getattr(widget, "row_index", None)
+            if index is not None:
+                return index
+            widget = widget.master
+        return None
+
+    def _on_cell_click(self, event):
+        """Shared click handler for every row and cell."""
+        index = self._row_index_of(event.widget)
+        if index is not None:
+            self._on_click(index)
+
+    def _on_cell_double_click(self, event):
+        """Shared double click handler for every row and cell."""
+        index = self._row_index_of(event.widget)
+        if index is not None:
+            self._on_double_click(index)
+
+    def _set_selection(self, index: Optional[int]):
+        """Move the selection, recoloring whichever of the two rows are bound."""
+        old, self._selected_row = self._selected_row, index
+        for idx in (old, index):
+            frame = self._bound.get(idx)
+            if frame is not None:
+                frame.base_color = self._row_color(idx)
+                frame.configure(fg_color=frame.base_color)
+
+    def _clear_selection(self):
+        """Remove the selection and its highlight."""
+        self._set_selection(None)
 
     def _on_click(self, index: int):
         """Handle row click."""
         # Update selection highlighting
-        if self._selected_row is not None and self._selected_row < len(self._row_frames):
-            old_bg = Colors.BG_CARD if self._selected_row % 2 == 0 else Colors.BG_LIGHT
-            self._row_frames[self._selected_row].configure(fg_color=old_bg)
-
-        self._selected_row = index
-        self._row_frames[index].configure(fg_color=Colors.PRIMARY_HOVER)
+        self._set_selection(index)
 
         if self._on_row_click and index < len(self._data):
             self._on_row_click(index, self._data[index])
@@ -177,18 +387,35 @@ class StatusBadge(ctk.CTkFrame):
             **kwargs
         )
 
-        label = ctk.CTkLabel(
+        self._color = color
+        self._label = ctk.CTkLabel(
             self,
             text=text,
             font=Fonts.get("small"),
             text_color=Colors.TEXT_PRIMARY,
         )
-        label.pack(padx=Spacing.PADDING_SMALL, pady=2)
+        self._label.pack(padx=Spacing.PADDING_SMALL, pady=2)
+
+    def set(self, text: str, color: str):
+        """Change the badge's text and color in place."""
+        if color != self._color:
+            self._color = color
+            self.configure(fg_color=color)
+        self._label.configure(text=text)
 
 
 def create_status_badge_renderer(status_colors: Dict[str, str]):
     """Create a renderer function for status badges."""
+    # Badge text and color for each known status, formatted once up front
+    badges = {
+        status: (status.replace("_", " ").title(), color)
+        for status, color in status_colors.items()
+    }
+
     def render(parent, value, row_data):
-        color = status_colors.get(value, Colors.TEXT_MUTED)
-        return StatusBadge(parent, text=str(value).replace("_", " ").title(), color=color)
+        badge = badges.get(value)
+        if badge is None:
+            badge = (str(value).replace("_", " ").title(), Colors.TEXT_MUTED)
+        text, color = badge
+        return StatusBadge(parent, text=text, color=color)
     return render
@@ -79,9 +79,12 @@ class MetricsCard(ctk.CTkFrame):
             self._subtitle_label.pack(fill="x")
 
     def update_value(self, value: str, subtitle: Optional[str] = None):
-        """Update the displayed value."""
-        self._value_label.configure(text=value)
-        if subtitle and hasattr(self, '_subtitle_label'):
+        """Update the displayed value, skipping labels whose text is unchanged."""
+        if value != self._value:
+            self._value = value
+            self._value_label.configure(text=value)
+        if subtitle and subtitle != self._subtitle and hasattr(self, '_subtitle_label'):
+            self._subtitle = subtitle
             self._subtitle_label.configure(text=subtitle)
 
 
@@ -1,14 +1,27 @@
 """Sidebar navigation component."""
 
 import customtkinter as ctk
+from functools import partial
 from typing import Callable, Optional
 
 from ..theme import Colors, Fonts, Spacing, Dimensions
 
+# Font tuples shared by every widget in this module
+_FONT_NORMAL = Fonts.get("normal")
+_FONT_SMALL = Fonts.get("small")
+_FONT_LARGE_BOLD = Fonts.get("large", "bold")
+_FONT_MEDIUM = Fonts.get("medium")
+
 
 class SidebarButton(ctk.CTkButton):
     """A button for the sidebar navigation."""
 
+    # configure() kwargs for the inactive and active states, indexed by bool
+    _STATE_STYLES = (
+        {"fg_color": "transparent", "text_color": Colors.TEXT_SECONDARY},
+        {"fg_color": Colors.SIDEBAR_ACTIVE, "text_color": Colors.TEXT_PRIMARY},
+    )
+
     def __init__(
         self,
         master,
@@ -24,7 +37,7 @@ class SidebarButton(ctk.CTkButton):
             anchor="w",
             height=40,
             corner_radius=8,
-            font=Fonts.get("normal"),
+            font=_FONT_NORMAL,
             fg_color="transparent",
             text_color=Colors.TEXT_SECONDARY,
             hover_color=Colors.SIDEBAR_HOVER,
@@ -34,17 +47,10 @@ class SidebarButton(ctk.CTkButton):
 
     def set_active(self, active: bool):
         """Set the active state of the button."""
+        if active == self._is_active:
+            return
         self._is_active = active
-        if active:
-            self.configure(
-                fg_color=Colors.SIDEBAR_ACTIVE,
-                text_color=Colors.TEXT_PRIMARY,
-            )
-        else:
-            self.configure(
-                fg_color="transparent",
-                text_color=Colors.TEXT_SECONDARY,
-            )
+        self.configure(**self._STATE_STYLES[active])
 
 
 class Sidebar(ctk.CTkFrame):
@@ -73,7 +79,7 @@ class Sidebar(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             title_frame,
             text="Interview",
-            font=Fonts.get("large", "bold"),
+            font=_FONT_LARGE_BOLD,
             text_color=Colors.TEXT_PRIMARY,
         )
         title_label.pack(anchor="w")
@@ -81,7 +87,7 @@ class Sidebar(ctk.CTkFrame):
         subtitle_label = ctk.CTkLabel(
             title_frame,
             text="Tracker",
-            font=Fonts.get("medium"),
+            font=_FONT_MEDIUM,
             text_color=Colors.PRIMARY,
         )
         subtitle_label.pack(anchor="w")
@@ -103,7 +109,7 @@ class Sidebar(ctk.CTkFrame):
                 self,
                 text=label,
                 icon=icon,
-                command=lambda v=view_id: self._on_button_click(v),
+                command=partial(self._on_button_click, view_id),
             )
             btn.pack(fill="x", padx=Spacing.PADDING_SMALL, pady=2)
             self._buttons[view_id] = btn
@@ -124,7 +130,7 @@ class Sidebar(ctk.CTkFrame):
             self,
             text="Settings",
             icon="\u2699",  # Gear emoji
-            command=lambda: self._on_button_click("settings"),
+            command=partial(self._on_button_click, "settings"),
         )
         settings_btn.pack(fill="x", padx=Spacing.PADDING_SMALL, pady=2)
         self._buttons["settings"] = settings_btn
@@ -133,7 +139,7 @@ class Sidebar(ctk.CTkFrame):
         version_label = ctk.CTkLabel(
             self,
             text="v1.0.0",
-            font=Fonts.get("small"),
+            font=_FONT_SMALL,
             text_color=Colors.TEXT_MUTED,
         )
         version_label.pack(pady=Spacing.PADDING_NORMAL)
@@ -143,9 +149,9 @@ class Sidebar(ctk.CTkFrame):
         if view_id == self._current_view:
             return
 
-        # Update button states
-        for vid, btn in self._buttons.items():
-            btn.set_active(vid == view_id)
+        # Only the old and new buttons change state
+        self._buttons[self._current_view].set_active(False)
+        self._buttons[view_id].set_active(True)
 
         self._current_view = view_id
         self.on_navigate(view_id)
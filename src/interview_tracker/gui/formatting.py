@@ -0,0 +1,24 @@
+"""Helpers for formatting values for display in views."""
+
+from datetime import datetime
+
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+_MONTHS_SHORT = tuple(name[:3] for name in _MONTHS)
+
+
+def truncate(text: str, limit: int) -> str:
+    """Shorten text to at most limit characters plus an ellipsis."""
+    return text if len(text) <= limit else f"{text[:limit]}…"
+
+
+def short_datetime(dt: datetime) -> str:
+    """Format as e.g. "Mar 05, 14:30", like strftime("%b %d, %H:%M")."""
+    return f"{_MONTHS_SHORT[dt.month - 1]} {dt.day:02d}, {dt.hour:02d}:{dt.minute:02d}"
+
+
+def long_datetime(dt: datetime) -> str:
+    """Format as e.g. "March 05, 2025 at 14:30", like strftime("%B %d, %Y at %H:%M")."""
+    return f"{_MONTHS[dt.month - 1]} {dt.day:02d}, {dt.year} at {dt.hour:02d}:{dt.minute:02d}"
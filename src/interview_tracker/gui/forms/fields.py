@@ -0,0 +1,13 @@
+"""Helpers for reading values out of form input widgets."""
+
+from typing import Optional
+
+
+def entry_text(entry) -> Optional[str]:
+    """Get an entry's text with surrounding whitespace removed, or None if blank."""
+    return entry.get().strip() or None
+
+
+def textbox_text(textbox) -> Optional[str]:
+    """Get a text box's contents with surrounding whitespace removed, or None if blank."""
+    return textbox.get("1.0", "end-1c").strip() or None
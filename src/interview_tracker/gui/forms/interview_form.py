@@ -1,19 +1,121 @@
 """Interview form dialog for scheduling interviews."""
 
+import re
+
 import customtkinter as ctk
 from datetime import datetime, date, timedelta
+from functools import partial
 from typing import Callable, Optional, List
 
+from ..async_runner import run_db, call_when_done
 from ..theme import Colors, Fonts, Spacing, Dimensions
-from ...core.schemas import InterviewCreate, InterviewUpdate
+from .fields import entry_text, textbox_text
 from ...core.enums import PipelineStage, InterviewMode, PrepStatus
 from ...services.interview import InterviewService
 from ...services.pipeline import PipelineService
+from ...services.query_cache import get_cached
 from ...data.database import get_db
 
+# Dropdown model for the active pipelines, from _build_pipeline_options():
+# ((id, name) pairs, names, id by name, name by id)
+_PipelineOptions = tuple[
+    tuple[tuple[int, str], ...], List[str], dict[str, int], dict[int, str]
+]
+
+# Seconds the dropdown options are reused by later opens; any database
+# write drops them sooner
+_PIPELINE_CACHE_TTL = 5.0
+
+# Interview columns copied out of the session for filling the edit form
+_INTERVIEW_FIELDS = (
+    "pipeline_id", "stage", "round_number", "scheduled_date", "duration_minutes",
+    "mode", "meeting_link", "interviewer_name", "interviewer_title", "topics",
+    "prep_notes",
+)
+
+# Fixed dialog size; also used to center it without measuring widgets
+_DIALOG_WIDTH = 550
+_DIALOG_HEIGHT = 700
+
+# Font tuples shared by every widget in this module
+_FONT_NORMAL = Fonts.get("normal")
+_FONT_SMALL = Fonts.get("small")
+_FONT_LARGE_BOLD = Fonts.get("large", "bold")
+
+# Keyword arguments shared by the entries and text boxes in this module
+_ENTRY_KW = {
+    "font": _FONT_NORMAL,
+    "height": Dimensions.INPUT_HEIGHT,
+    "corner_radius": Dimensions.INPUT_CORNER_RADIUS,
+}
+_TEXTBOX_KW = {
+    "font": _FONT_NORMAL,
+    "corner_radius": Dimensions.INPUT_CORNER_RADIUS,
+}
+
+# "YYYY-MM-DD" and "HH:MM"; month, day and hour may be one digit, as with strptime
+_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{1,2})")
+
+# Comma separator for the topics field, swallowing the spaces around it
+_COMMA_SPLIT_RE = re.compile(r"\s*,\s*")
+
+# Dropdown options and their reverse lookups, built once per process
+_STAGE_OPTIONS = tuple(s.display_name for s in PipelineStage if not s.is_terminal)
+_STAGE_BY_NAME = {s.display_name: s for s in PipelineStage}
+_MODE_OPTIONS = tuple(m.display_name for m in InterviewMode)
+_MODE_BY_NAME = {m.display_name: m for m in InterviewMode}
+
+
+def _build_pipeline_options(pipelines: tuple[tuple[int, str], ...]) -> _PipelineOptions:
+    """Build the dropdown names and lookups for a pipeline list once."""
+    return (
+        pipelines,
+        [name for _, name in pipelines],
+        # Built in reverse so the first of any duplicate names wins
+        {name: pid for pid, name in reversed(pipelines)},
+        dict(pipelines),
+    )
+
+
+def _load_pipeline_options() -> _PipelineOptions:
+    """Query the active pipelines as dropdown options (worker thread)."""
+    db = get_db()
+
+    with db.session_scope() as session:
+        return _build_pipeline_options(tuple(
+            (p.id, f"{p.company} - {p.role[:30]}")
+            for p in PipelineService(session).get_active()
+        ))
+
 
 class InterviewFormDialog(ctk.CTkToplevel):
-    """Dialog for scheduling or editing an interview."""
+    """
+    Dialog for scheduling or editing an interview.
+
+    Use open() rather than the constructor: it keeps one dialog per master
+    and hides it on close, so later opens reset the fields instead of
+    rebuilding every widget.
+    """
+
+    _instance: Optional["InterviewFormDialog"] = None
+
+    @classmethod
+    def open(
+        cls,
+        master,
+        interview_id: Optional[int] = None,
+        pipeline_id: Optional[int] = None,
+        on_save: Optional[Callable[[], None]] = None,
+    ) -> "InterviewFormDialog":
+        """Show the shared dialog, building it on first use."""
+        dialog = cls._instance
+        if dialog is None or dialog.master is not master or not dialog.winfo_exists():
+            dialog = cls(master, interview_id=interview_id, pipeline_id=pipeline_id, on_save=on_save)
+            cls._instance = dialog
+        else:
+            dialog._show(interview_id, pipeline_id, on_save)
+        return dialog
 
     def __init__(
         self,
@@ -25,117 +127,243 @@ class InterviewFormDialog(ctk.CTkToplevel):
     ):
         super().__init__(master, **kwargs)
 
+        self._pipelines: tuple[tuple[int, str], ...] = ()
+        self._pipeline_id_by_name: dict[str, int] = {}
+        self._pipeline_name_by_id: dict[int, str] = {}
+        # Bumped per open so a slow form-data load cannot fill a later form
+        self._load_generation = 0
+        # Pending <Map> binding that makes the dialog modal once it is shown
+        self._map_binding: Optional[str] = None
+
+        self.resizable(False, False)
+        self.protocol("WM_DELETE_WINDOW", self._close)
+
+        self._create_widgets()
+        self._show(interview_id, pipeline_id, on_save)
+
+    def _show(
+        self,
+        interview_id: Optional[int],
+        pipeline_id: Optional[int],
+        on_save: Optional[Callable[[], None]],
+    ):
+        """Reset the form for a new open and bring the dialog up."""
         self._interview_id = interview_id
         self._pipeline_id = pipeline_id
         self._on_save = on_save
         self._is_edit = interview_id is not None
-        self._pipelines: List[tuple[int, str]] = []
 
-        self.title("Edit Interview" if self._is_edit else "Schedule Interview")
-        self.geometry("550x700")
-        self.resizable(False, False)
+        # Fill the form while hidden so the field updates draw once, on show.
+        # An edit stays hidden until the interview has been filled in.
+        self.withdraw()
+
+        title = "Edit Interview" if self._is_edit else "Schedule Interview"
+        self.title(title)
+        self._title_label.configure(text=title)
+        self._reset_fields()
+
+        # Pipelines (and the interview being edited) load off the Tk thread,
+        # separately so each can fail on its own; the fields fill in when ready
+        self._load_generation += 1
+        generation = self._load_generation
+        call_when_done(
+            self,
+            run_db(get_cached, ("form_pipelines",), _PIPELINE_CACHE_TTL, _load_pipeline_options),
+            partial(self._apply_pipelines, generation),
+            on_error=partial(self._on_pipelines_error, generation),
+        )
+        if interview_id is not None:
+            call_when_done(
+                self,
+                run_db(self._load_interview, interview_id),
+                partial(self._apply_interview, generation),
+                on_error=partial(self._on_interview_error, generation),
+            )
+
+        if not self._is_edit:
+            self._present()
+
+    def _present(self):
+        """Put the filled-in dialog on screen, centered on its parent."""
+        # Make modal after the window is mapped, keeping the window-manager
+        # round-trip off the path that puts the dialog on screen
+        if self._map_binding is None:
+            self._map_binding = self.bind("<Map>", self._on_map, add="+")
+        self.deiconify()
 
-        # Make modal
-        self.transient(master)
+        # Center on parent
+        master = self.master
+        x = master.winfo_x() + (master.winfo_width() - _DIALOG_WIDTH) // 2
+        y = master.winfo_y() + (master.winfo_height() - _DIALOG_HEIGHT) // 2
+        self.geometry(f"{_DIALOG_WIDTH}x{_DIALOG_HEIGHT}+{x}+{y}")
+
+    def _on_map(self, event):
+        """Make the dialog modal the first time it is mapped after an open."""
+        # Child widgets share the toplevel's bindings; only react to the window
+        if event.widget is not self:
+            return
+        self.unbind("<Map>", self._map_binding)
+        self._map_binding = None
+        self.transient(self.master)
         self.grab_set()
 
-        self._load_pipelines()
-        self._create_widgets()
+    def _reset_fields(self):
+        """Return every input to its empty or default state."""
+        self._pipelines = ()
+        self._pipeline_id_by_name = {}
+        self._pipeline_name_by_id = {}
+        self._pipeline_dropdown.configure(values=["Loading..."], state="disabled")
+        self._pipeline_dropdown.set("Loading...")
+        self._stage_dropdown.set(_STAGE_OPTIONS[0])
+        self._mode_dropdown.set(_MODE_OPTIONS[0])
+
+        for entry, default in (
+            (self._round_entry, "1"),
+            (self._date_entry, ""),
+            (self._time_entry, ""),
+            (self._duration_entry, "60"),
+            (self._link_entry, ""),
+            (self._interviewer_entry, ""),
+            (self._interviewer_title_entry, ""),
+            (self._topics_entry, ""),
+        ):
+            entry.delete(0, "end")
+            if default:
+                entry.insert(0, default)
+
+        self._prep_notes_text.delete("1.0", "end")
+        self._error_label.configure(text="")
+
+    def _close(self):
+        """Hide the dialog for reuse instead of destroying it."""
+        self.grab_release()
+        self.withdraw()
+        self._on_save = None
+
+    @staticmethod
+    def _load_interview(interview_id: int) -> Optional[dict]:
+        """Read the interview being edited into a plain dict (worker thread)."""
+        db = get_db()
 
-        if self._is_edit:
-            self._load_interview()
-        elif self._pipeline_id:
-            # Pre-select pipeline
-            for i, (pid, name) in enumerate(self._pipelines):
-                if pid == self._pipeline_id:
-                    self._pipeline_dropdown.set(name)
-                    break
+        with db.session_scope() as session:
+            record = InterviewService(session).get(interview_id)
+            if record is None:
+                return None
+            return {field: getattr(record, field) for field in _INTERVIEW_FIELDS}
+
+    def _apply_interview(self, generation: int, interview: Optional[dict]):
+        """Fill the fields from the loaded interview (Tk thread)."""
+        if generation != self._load_generation:
+            return
 
-        # Center on parent
-        self.update_idletasks()
-        x = master.winfo_x() + (master.winfo_width() - self.winfo_width()) // 2
-        y = master.winfo_y() + (master.winfo_height() - self.winfo_height()) // 2
-        self.geometry(f"+{x}+{y}")
+        if interview is None:
+            self._error_label.configure(text="Interview not found")
+        else:
+            self._fill_interview(interview)
+            # The pipeline list may have arrived first with a default selection
+            if self._pipelines:
+                self._select_pipeline()
+        self._present()
+
+    def _on_interview_error(self, generation: int, exc: BaseException):
+        """Report a failed interview load (Tk thread)."""
+        if generation == self._load_generation:
+            self._error_label.configure(text="Could not load interview")
+            self._present()
+
+    def _apply_pipelines(self, generation: int, options: _PipelineOptions):
+        """Fill the pipeline dropdown with loaded pipeline options (Tk thread)."""
+        if generation != self._load_generation:
+            return
 
-    def _load_pipelines(self):
-        """Load active pipelines for dropdown."""
-        db = get_db()
+        (
+            self._pipelines,
+            pipeline_names,
+            self._pipeline_id_by_name,
+            self._pipeline_name_by_id,
+        ) = options
 
-        with db.session_scope() as session:
-            service = PipelineService(session)
-            pipelines = service.get_active()
-            self._pipelines = [
-                (p.id, f"{p.company} - {p.role[:30]}")
-                for p in pipelines
-            ]
+        self._pipeline_dropdown.configure(
+            values=pipeline_names if pipeline_names else ["No active pipelines"],
+            state="normal",
+        )
+        self._select_pipeline()
+
+    def _select_pipeline(self):
+        """Pre-select the requested pipeline, or the first one."""
+        selected = self._pipeline_name_by_id.get(self._pipeline_id)
+        if selected is None:
+            selected = self._pipelines[0][1] if self._pipelines else "No active pipelines"
+        self._pipeline_dropdown.set(selected)
+
+    def _on_pipelines_error(self, generation: int, exc: BaseException):
+        """Report a failed pipeline load (Tk thread)."""
+        if generation == self._load_generation:
+            self._pipeline_dropdown.set("Could not load pipelines")
 
     def _create_widgets(self):
         """Create form widgets."""
         main_frame = ctk.CTkFrame(self, fg_color="transparent")
         main_frame.pack(fill="both", expand=True, padx=Spacing.PADDING_LARGE, pady=Spacing.PADDING_LARGE)
 
-        # Title
-        title = ctk.CTkLabel(
+        # Title (text is set per open)
+        self._title_label = ctk.CTkLabel(
             main_frame,
-            text="Edit Interview" if self._is_edit else "Schedule Interview",
-            font=Fonts.get("large", "bold"),
+            text="",
+            font=_FONT_LARGE_BOLD,
             text_color=Colors.TEXT_PRIMARY,
         )
-        title.pack(anchor="w", pady=(0, Spacing.PADDING_LARGE))
+        self._title_label.pack(anchor="w", pady=(0, Spacing.PADDING_LARGE))
 
         # Scrollable form
         form_frame = ctk.CTkScrollableFrame(main_frame, fg_color="transparent")
         form_frame.pack(fill="both", expand=True)
+        form_frame.grid_columnconfigure(0, weight=1)
+        self._form_row = 0
 
         # Pipeline selection
         self._add_field(form_frame, "Pipeline *")
-        pipeline_names = [name for _, name in self._pipelines]
         self._pipeline_dropdown = ctk.CTkOptionMenu(
             form_frame,
-            values=pipeline_names if pipeline_names else ["No active pipelines"],
-            font=Fonts.get("normal"),
+            values=["Loading..."],
+            state="disabled",
+            font=_FONT_NORMAL,
             fg_color=Colors.BG_CARD,
             button_color=Colors.PRIMARY,
             height=Dimensions.INPUT_HEIGHT,
         )
-        self._pipeline_dropdown.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
+        self._grid_field(self._pipeline_dropdown)
 
         # Stage
         self._add_field(form_frame, "Interview Stage *")
-        stage_options = [s.display_name for s in PipelineStage if not s.is_terminal]
         self._stage_dropdown = ctk.CTkOptionMenu(
             form_frame,
-            values=stage_options,
-            font=Fonts.get("normal"),
+            values=_STAGE_OPTIONS,
+            font=_FONT_NORMAL,
             fg_color=Colors.BG_CARD,
             button_color=Colors.PRIMARY,
             height=Dimensions.INPUT_HEIGHT,
         )
-        self._stage_dropdown.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
+        self._grid_field(self._stage_dropdown)
 
         # Round number
         self._add_field(form_frame, "Round Number")
         self._round_entry = ctk.CTkEntry(
             form_frame,
-            font=Fonts.get("normal"),
-            height=Dimensions.INPUT_HEIGHT,
-            corner_radius=Dimensions.INPUT_CORNER_RADIUS,
+            **_ENTRY_KW,
             placeholder_text="1",
         )
-        self._round_entry.insert(0, "1")
-        self._round_entry.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
+        self._grid_field(self._round_entry)
 
         # Date and Time
         self._add_field(form_frame, "Date and Time *")
         datetime_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
-        datetime_frame.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
+        self._grid_field(datetime_frame)
 
         # Date entry (simple text for now)
         self._date_entry = ctk.CTkEntry(
             datetime_frame,
-            font=Fonts.get("normal"),
-            height=Dimensions.INPUT_HEIGHT,
-            corner_radius=Dimensions.INPUT_CORNER_RADIUS,
+            **_ENTRY_KW,
             placeholder_text="YYYY-MM-DD",
             width=150,
         )
@@ -144,9 +372,7 @@ class InterviewFormDialog(ctk.CTkToplevel):
         # Time entry
         self._time_entry = ctk.CTkEntry(
             datetime_frame,
-            font=Fonts.get("normal"),
-            height=Dimensions.INPUT_HEIGHT,
-            corner_radius=Dimensions.INPUT_CORNER_RADIUS,
+            **_ENTRY_KW,
             placeholder_text="HH:MM",
             width=100,
         )
@@ -156,84 +382,71 @@ class InterviewFormDialog(ctk.CTkToplevel):
         self._add_field(form_frame, "Duration (minutes)")
         self._duration_entry = ctk.CTkEntry(
             form_frame,
-            font=Fonts.get("normal"),
-            height=Dimensions.INPUT_HEIGHT,
-            corner_radius=Dimensions.INPUT_CORNER_RADIUS,
+            **_ENTRY_KW,
         )
-        self._duration_entry.insert(0, "60")
-        self._duration_entry.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
+        self._grid_field(self._duration_entry)
 
         # Mode
         self._add_field(form_frame, "Interview Mode")
-        mode_options = [m.display_name for m in InterviewMode]
         self._mode_dropdown = ctk.CTkOptionMenu(
             form_frame,
-            values=mode_options,
-            font=Fonts.get("normal"),
+            values=_MODE_OPTIONS,
+            font=_FONT_NORMAL,
             fg_color=Colors.BG_CARD,
             button_color=Colors.PRIMARY,
             height=Dimensions.INPUT_HEIGHT,
         )
-        self._mode_dropdown.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
+        self._grid_field(self._mode_dropdown)
 
         # Meeting link
         self._add_field(form_frame, "Meeting Link")
         self._link_entry = ctk.CTkEntry(
             form_frame,
-            font=Fonts.get("normal"),
-            height=Dimensions.INPUT_HEIGHT,
-            corner_radius=Dimensions.INPUT_CORNER_RADIUS,
+            **_ENTRY_KW,
             placeholder_text="https://...",
         )
-        self._link_entry.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
+        self._grid_field(self._link_entry)
 
         # Interviewer name
         self._add_field(form_frame, "Interviewer Name")
         self._interviewer_entry = ctk.CTkEntry(
             form_frame,
-            font=Fonts.get("normal"),
-            height=Dimensions.INPUT_HEIGHT,
-            corner_radius=Dimensions.INPUT_CORNER_RADIUS,
+            **_ENTRY_KW,
         )
-        self._interviewer_entry.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
+        self._grid_field(self._interviewer_entry)
 
         # Interviewer title
         self._add_field(form_frame, "Interviewer Title")
         self._interviewer_title_entry = ctk.CTkEntry(
             form_frame,
-            font=Fonts.get("normal"),
-            height=Dimensions.INPUT_HEIGHT,
-            corner_radius=Dimensions.INPUT_CORNER_RADIUS,
+            **_ENTRY_KW,
             placeholder_text="e.g., Senior Engineer, Engineering Manager",
         )
-        self._interviewer_title_entry.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
+        self._grid_field(self._interviewer_title_entry)
 
         # Topics
         self._add_field(form_frame, "Topics to Prepare (comma-separated)")
         self._topics_entry = ctk.CTkEntry(
             form_frame,
-            font=Fonts.get("normal"),
-            height=Dimensions.INPUT_HEIGHT,
-            corner_radius=Dimensions.INPUT_CORNER_RADIUS,
+            **_ENTRY_KW,
             placeholder_text="e.g., System Design, Algorithms, Behavioral",
         )
-        self._topics_entry.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
+        self._grid_field(self._topics_entry)
 
         # Prep notes
         self._add_field(form_frame, "Preparation Notes")
         self._prep_notes_text = ctk.CTkTextbox(
             form_frame,
-            font=Fonts.get("normal"),
             height=80,
-            corner_radius=Dimensions.INPUT_CORNER_RADIUS,
+            **_TEXTBOX_KW,
         )
-        self._prep_notes_text.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
+        self._grid_field(self._prep_notes_text)
 
         # Error label
         self._error_label = ctk.CTkLabel(
             main_frame,
             text="",
-            font=Fonts.get("normal"),
+            font=_FONT_NORMAL,
             text_color=Colors.DANGER,
         )
         self._error_label.pack(pady=(Spacing.PADDING_SMALL, 0))
@@ -245,19 +458,19 @@ class InterviewFormDialog(ctk.CTkToplevel):
         cancel_btn = ctk.CTkButton(
             button_frame,
             text="Cancel",
-            font=Fonts.get("normal"),
+            font=_FONT_NORMAL,
             fg_color="transparent",
             text_color=Colors.TEXT_SECONDARY,
             hover_color=Colors.BG_LIGHT,
             height=Dimensions.BUTTON_HEIGHT,
-            command=self.destroy,
+            command=self._close,
         )
         cancel_btn.pack(side="left")
 
         save_btn = ctk.CTkButton(
             button_frame,
             text="Save",
-            font=Fonts.get("normal"),
+            font=_FONT_NORMAL,
             fg_color=Colors.PRIMARY,
             hover_color=Colors.PRIMARY_HOVER,
             height=Dimensions.BUTTON_HEIGHT,
@@ -266,84 +479,61 @@ class InterviewFormDialog(ctk.CTkToplevel):
         save_btn.pack(side="right")
 
     def _add_field(self, parent, label: str):
-        """Add a field label."""
+        """Add a field label on the next form row."""
         label_widget = ctk.CTkLabel(
             parent,
             text=label,
-            font=Fonts.get("small"),
+            font=_FONT_SMALL,
             text_color=Colors.TEXT_MUTED,
         )
-        label_widget.pack(anchor="w")
-
-    def _load_interview(self):
-        """Load existing interview data for editing."""
-        db = get_db()
-
-        with db.session_scope() as session:
-            service = InterviewService(session)
-            interview = service.get_with_pipeline(self._interview_id)
-
-            if interview:
-                # Set pipeline
-                for i, (pid, name) in enumerate(self._pipelines):
-                    if pid == interview.pipeline_id:
-                        self._pipeline_dropdown.set(name)
-                        break
-
-                # Set stage
-                stage = PipelineStage(interview.stage)
-                self._stage_dropdown.set(stage.display_name)
-
-                # Set round
-                self._round_entry.delete(0, "end")
-                self._round_entry.insert(0, str(interview.round_number))
-
-                # Set date/time
-                if interview.scheduled_date:
-                    self._date_entry.insert(0, interview.scheduled_date.strftime("%Y-%m-%d"))
-                    self._time_entry.insert(0, interview.scheduled_date.strftime("%H:%M"))
-
-                # Set duration
-                self._duration_entry.delete(0, "end")
-                self._duration_entry.insert(0, str(interview.duration_minutes))
-
-                # Set mode
-                mode = InterviewMode(interview.mode)
-                self._mode_dropdown.set(mode.display_name)
-
-                # Set other fields
-                if interview.meeting_link:
-                    self._link_entry.insert(0, interview.meeting_link)
-                if interview.interviewer_name:
-                    self._interviewer_entry.insert(0, interview.interviewer_name)
-                if interview.interviewer_title:
-                    self._interviewer_title_entry.insert(0, interview.interviewer_title)
-                if interview.topics:
-                    self._topics_entry.insert(0, ", ".join(interview.topics))
-                if interview.prep_notes:
-                    self._prep_notes_text.insert("1.0", interview.prep_notes)
+        label_widget.grid(row=self._form_row, column=0, sticky="w")
+        self._form_row += 1
+
+    def _grid_field(self, widget):
+        """Place a field's input widget on the next form row."""
+        widget.grid(row=self._form_row, column=0, sticky="ew", pady=(0, Spacing.PADDING_NORMAL))
+        self._form_row += 1
+
+    def _fill_interview(self, interview: dict):
+        """Fill the fields from an interview loaded for editing."""
+        # Selected once the pipeline list is applied
+        self._pipeline_id = interview["pipeline_id"]
+
+        self._stage_dropdown.set(PipelineStage(interview["stage"]).display_name)
+        self._mode_dropdown.set(InterviewMode(interview["mode"]).display_name)
+
+        scheduled_date = interview["scheduled_date"]
+        topics = interview["topics"]
+        # Entries are cleared before each value so nothing is appended to
+        for entry, text in (
+            (self._round_entry, str(interview["round_number"])),
+            (self._date_entry, scheduled_date.strftime("%Y-%m-%d") if scheduled_date else ""),
+            (self._time_entry, scheduled_date.strftime("%H:%M") if scheduled_date else ""),
+            (self._duration_entry, str(interview["duration_minutes"])),
+            (self._link_entry, interview["meeting_link"] or ""),
+            (self._interviewer_entry, interview["interviewer_name"] or ""),
+            (self._interviewer_title_entry, interview["interviewer_title"] or ""),
+            (self._topics_entry, ", ".join(topics) if topics else ""),
+        ):
+            entry.delete(0, "end")
+            if text:
+                entry.insert(0, text)
+
+        self._prep_notes_text.delete("1.0", "end")
+        if interview["prep_notes"]:
+            self._prep_notes_text.insert("1.0", interview["prep_notes"])
 
     def _on_save_click(self):
         """Handle save button click."""
         # Validate pipeline
-        pipeline_name = self._pipeline_dropdown.get()
-        pipeline_id = None
-        for pid, name in self._pipelines:
-            if name == pipeline_name:
-                pipeline_id = pid
-                break
+        pipeline_id = self._pipeline_id_by_name.get(self._pipeline_dropdown.get())
 
         if not pipeline_id:
             self._error_label.configure(text="Please select a pipeline")
             return
 
         # Validate stage
-        stage_name = self._stage_dropdown.get()
-        stage = None
-        for s in PipelineStage:
-            if s.display_name == stage_name:
-                stage = s
-                break
+        stage = _STAGE_BY_NAME.get(self._stage_dropdown.get())
 
         if not stage:
             self._error_label.configure(text="Please select a stage")
@@ -357,8 +547,14 @@ class InterviewFormDialog(ctk.CTkToplevel):
             self._error_label.configure(text="Please enter date and time")
             return
 
+        date_match = _DATE_RE.fullmatch(date_str)
+        time_match = _TIME_RE.fullmatch(time_str) if date_match else None
         try:
-            scheduled_date = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+            if not time_match:
+                raise ValueError
+            scheduled_date = datetime(
+                *map(int, date_match.groups()), *map(int, time_match.groups())
+            )
         except ValueError:
             self._error_label.configure(text="Invalid date/time format. Use YYYY-MM-DD HH:MM")
             return
@@ -374,21 +570,18 @@ class InterviewFormDialog(ctk.CTkToplevel):
         except ValueError:
             duration = 60
 
-        mode_name = self._mode_dropdown.get()
-        mode = InterviewMode.VIDEO
-        for m in InterviewMode:
-            if m.display_name == mode_name:
-                mode = m
-                break
+        mode = _MODE_BY_NAME.get(self._mode_dropdown.get(), InterviewMode.VIDEO)
 
-        meeting_link = self._link_entry.get().strip() or None
-        interviewer_name = self._interviewer_entry.get().strip() or None
-        interviewer_title = self._interviewer_title_entry.get().strip() or None
+        meeting_link = entry_text(self._link_entry)
+        interviewer_name = entry_text(self._interviewer_entry)
+        interviewer_title = entry_text(self._interviewer_title_entry)
 
         topics_str = self._topics_entry.get().strip()
-        topics = [t.strip() for t in topics_str.split(",") if t.strip()] if topics_str else None
+        topics = [t for t in _COMMA_SPLIT_RE.split(topics_str) if t] or None
+
+        prep_notes = textbox_text(self._prep_notes_text)
 
-        prep_notes = self._prep_notes_text.get("1.0", "end-1c").strip() or None
+        from ...core.schemas import InterviewCreate, InterviewUpdate
 
         db = get_db()
 
@@ -424,9 +617,10 @@ class InterviewFormDialog(ctk.CTkToplevel):
                         prep_notes=prep_notes,
                     ))
 
-            if self._on_save:
-                self._on_save()
-            self.destroy()
+            on_save = self._on_save
+            self._close()
+            if on_save:
+                on_save()
 
         except Exception as e:
             self._error_label.configure(text=f"Error: {str(e)}")
@@ -4,12 +4,39 @@ import customtkinter as ctk
 from datetime import date
 from typing import Callable, Optional
 
+from ..async_runner import run_db, call_when_done
 from ..theme import Colors, Fonts, Spacing, Dimensions
-from ...core.schemas import PipelineCreate, PipelineUpdate
+from .fields import entry_text, textbox_text
 from ...core.enums import Priority
 from ...services.pipeline import PipelineService
 from ...data.database import get_db
 
+# Fixed dialog size; also used to center it without measuring widgets
+_DIALOG_WIDTH = 500
+_DIALOG_HEIGHT = 600
+
+# Font tuples shared by every widget in this module
+_FONT_NORMAL = Fonts.get("normal")
+_FONT_SMALL = Fonts.get("small")
+_FONT_LARGE_BOLD = Fonts.get("large", "bold")
+
+# Keyword arguments shared by the entries and text boxes in this module
+_ENTRY_KW = {
+    "font": _FONT_NORMAL,
+    "height": Dimensions.INPUT_HEIGHT,
+    "corner_radius": Dimensions.INPUT_CORNER_RADIUS,
+}
+_TEXTBOX_KW = {
+    "font": _FONT_NORMAL,
+    "corner_radius": Dimensions.INPUT_CORNER_RADIUS,
+}
+
+_REMOTE_OPTIONS = ("Not specified", "Remote", "Hybrid", "On-site")
+
+# Priority segments in order, and the stored value each one stands for
+_PRIORITY_OPTIONS = tuple(p.display_name for p in Priority)
+_PRIORITY_BY_NAME = {p.display_name: p.value for p in Priority}
+
 
 class PipelineFormDialog(ctk.CTkToplevel):
     """Dialog for adding or editing a pipeline."""
@@ -26,37 +53,48 @@ class PipelineFormDialog(ctk.CTkToplevel):
         self._pipeline_id = pipeline_id
         self._on_save = on_save
         self._is_edit = pipeline_id is not None
+        self._saving = False
 
         self.title("Edit Pipeline" if self._is_edit else "Add Pipeline")
-        self.geometry("500x600")
         self.resizable(False, False)
 
+        # Center on parent from the fixed size, without measuring widgets
+        x = master.winfo_x() + (master.winfo_width() - _DIALOG_WIDTH) // 2
+        y = master.winfo_y() + (master.winfo_height() - _DIALOG_HEIGHT) // 2
+        self.geometry(f"{_DIALOG_WIDTH}x{_DIALOG_HEIGHT}+{x}+{y}")
+
         # Make modal
         self.transient(master)
         self.grab_set()
 
+        # Build the form once the window is mapped, so the empty dialog
+        # appears first instead of after every widget is constructed
+        self._map_binding = self.bind("<Map>", self._on_first_map, add="+")
+
+    def _on_first_map(self, event):
+        """Build and fill the form the first time the dialog is mapped."""
+        # Child widgets share the toplevel's bindings; only react to the window
+        if event.widget is not self:
+            return
+        self.unbind("<Map>", self._map_binding)
+
         self._create_widgets()
 
         if self._is_edit:
+            # Nothing can be typed or saved until the pipeline has filled the form
+            self._set_inputs_state("disabled")
             self._load_pipeline()
 
-        # Center on parent
-        self.update_idletasks()
-        x = master.winfo_x() + (master.winfo_width() - self.winfo_width()) // 2
-        y = master.winfo_y() + (master.winfo_height() - self.winfo_height()) // 2
-        self.geometry(f"+{x}+{y}")
-
     def _create_widgets(self):
         """Create form widgets."""
         # Main container
         main_frame = ctk.CTkFrame(self, fg_color="transparent")
-        main_frame.pack(fill="both", expand=True, padx=Spacing.PADDING_LARGE, pady=Spacing.PADDING_LARGE)
 
         # Title
         title = ctk.CTkLabel(
             main_frame,
             text="Edit Pipeline" if self._is_edit else "Add New Pipeline",
-            font=Fonts.get("large", "bold"),
+            font=_FONT_LARGE_BOLD,
             text_color=Colors.TEXT_PRIMARY,
         )
         title.pack(anchor="w", pady=(0, Spacing.PADDING_LARGE))
@@ -69,9 +107,7 @@ class PipelineFormDialog(ctk.CTkToplevel):
         self._add_field(form_frame, "Company *")
         self._company_entry = ctk.CTkEntry(
             form_frame,
-            font=Fonts.get("normal"),
-            height=Dimensions.INPUT_HEIGHT,
-            corner_radius=Dimensions.INPUT_CORNER_RADIUS,
+            **_ENTRY_KW,
         )
         self._company_entry.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
 
@@ -79,9 +115,7 @@ class PipelineFormDialog(ctk.CTkToplevel):
         self._add_field(form_frame, "Role / Position *")
         self._role_entry = ctk.CTkEntry(
             form_frame,
-            font=Fonts.get("normal"),
-            height=Dimensions.INPUT_HEIGHT,
-            corner_radius=Dimensions.INPUT_CORNER_RADIUS,
+            **_ENTRY_KW,
         )
         self._role_entry.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
 
@@ -89,9 +123,7 @@ class PipelineFormDialog(ctk.CTkToplevel):
         self._add_field(form_frame, "Job Posting URL")
         self._url_entry = ctk.CTkEntry(
             form_frame,
-            font=Fonts.get("normal"),
-            height=Dimensions.INPUT_HEIGHT,
-            corner_radius=Dimensions.INPUT_CORNER_RADIUS,
+            **_ENTRY_KW,
             placeholder_text="https://...",
         )
         self._url_entry.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
@@ -100,9 +132,7 @@ class PipelineFormDialog(ctk.CTkToplevel):
         self._add_field(form_frame, "Location")
         self._location_entry = ctk.CTkEntry(
             form_frame,
-            font=Fonts.get("normal"),
-            height=Dimensions.INPUT_HEIGHT,
-            corner_radius=Dimensions.INPUT_CORNER_RADIUS,
+            **_ENTRY_KW,
             placeholder_text="City, State or Remote",
         )
         self._location_entry.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
@@ -111,8 +141,8 @@ class PipelineFormDialog(ctk.CTkToplevel):
         self._add_field(form_frame, "Remote Policy")
         self._remote_dropdown = ctk.CTkOptionMenu(
             form_frame,
-            values=["Not specified", "Remote", "Hybrid", "On-site"],
-            font=Fonts.get("normal"),
+            values=_REMOTE_OPTIONS,
+            font=_FONT_NORMAL,
             fg_color=Colors.BG_CARD,
             button_color=Colors.PRIMARY,
             height=Dimensions.INPUT_HEIGHT,
@@ -123,36 +153,27 @@ class PipelineFormDialog(ctk.CTkToplevel):
         self._add_field(form_frame, "Salary Range")
         self._salary_entry = ctk.CTkEntry(
             form_frame,
-            font=Fonts.get("normal"),
-            height=Dimensions.INPUT_HEIGHT,
-            corner_radius=Dimensions.INPUT_CORNER_RADIUS,
+            **_ENTRY_KW,
             placeholder_text="e.g., $150,000 - $180,000",
         )
         self._salary_entry.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
 
         # Priority
         self._add_field(form_frame, "Priority")
-        priority_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
-        priority_frame.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
-
-        self._priority_var = ctk.IntVar(value=2)
-        for p in Priority:
-            rb = ctk.CTkRadioButton(
-                priority_frame,
-                text=p.display_name,
-                variable=self._priority_var,
-                value=p.value,
-                font=Fonts.get("normal"),
-            )
-            rb.pack(side="left", padx=Spacing.PADDING_SMALL)
+        self._priority_selector = ctk.CTkSegmentedButton(
+            form_frame,
+            values=_PRIORITY_OPTIONS,
+            font=_FONT_NORMAL,
+        )
+        self._priority_selector.set(Priority.MEDIUM.display_name)
+        self._priority_selector.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
 
         # Notes
         self._add_field(form_frame, "Notes")
         self._notes_text = ctk.CTkTextbox(
             form_frame,
-            font=Fonts.get("normal"),
             height=100,
-            corner_radius=Dimensions.INPUT_CORNER_RADIUS,
+            **_TEXTBOX_KW,
         )
         self._notes_text.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
 
@@ -160,7 +181,7 @@ class PipelineFormDialog(ctk.CTkToplevel):
         self._error_label = ctk.CTkLabel(
             main_frame,
             text="",
-            font=Fonts.get("normal"),
+            font=_FONT_NORMAL,
             text_color=Colors.DANGER,
         )
         self._error_label.pack(pady=(Spacing.PADDING_SMALL, 0))
@@ -172,7 +193,7 @@ class PipelineFormDialog(ctk.CTkToplevel):
         cancel_btn = ctk.CTkButton(
             button_frame,
             text="Cancel",
-            font=Fonts.get("normal"),
+            font=_FONT_NORMAL,
             fg_color="transparent",
             text_color=Colors.TEXT_SECONDARY,
             hover_color=Colors.BG_LIGHT,
@@ -181,55 +202,95 @@ class PipelineFormDialog(ctk.CTkToplevel):
         )
         cancel_btn.pack(side="left")
 
-        save_btn = ctk.CTkButton(
+        self._save_btn = ctk.CTkButton(
             button_frame,
             text="Save",
-            font=Fonts.get("normal"),
+            font=_FONT_NORMAL,
             fg_color=Colors.PRIMARY,
             hover_color=Colors.PRIMARY_HOVER,
             height=Dimensions.BUTTON_HEIGHT,
             command=self._on_save_click,
         )
-        save_btn.pack(side="right")
+        self._save_btn.pack(side="right")
+
+        # Everything _set_inputs_state toggles while an edit loads
+        self._inputs = (
+            self._company_entry, self._role_entry, self._url_entry,
+            self._location_entry, self._remote_dropdown, self._salary_entry,
+            self._priority_selector, self._notes_text, self._save_btn,
+        )
+
+        # Pack the container last so the finished form is laid out and
+        # drawn in one pass rather than reflowing as each field is added
+        main_frame.pack(fill="both", expand=True, padx=Spacing.PADDING_LARGE, pady=Spacing.PADDING_LARGE)
 
     def _add_field(self, parent, label: str):
         """Add a field label."""
         label_widget = ctk.CTkLabel(
             parent,
             text=label,
-            font=Fonts.get("small"),
+            font=_FONT_SMALL,
             text_color=Colors.TEXT_MUTED,
         )
         label_widget.pack(anchor="w")
 
     def _load_pipeline(self):
-        """Load existing pipeline data for editing."""
+        """Load existing pipeline data for editing off the Tk thread."""
+        call_when_done(
+            self,
+            run_db(self._fetch_pipeline, self._pipeline_id),
+            self._apply_pipeline_data,
+            on_error=self._on_load_error,
+        )
+
+    @staticmethod
+    def _fetch_pipeline(pipeline_id: int) -> Optional[dict]:
+        """Read the pipeline into a plain dict (worker thread)."""
         db = get_db()
 
         with db.session_scope() as session:
-            service = PipelineService(session)
-            pipeline = service.get(self._pipeline_id)
-
-            if pipeline:
-                self._company_entry.insert(0, pipeline.company)
-                self._role_entry.insert(0, pipeline.role)
-                if pipeline.job_url:
-                    self._url_entry.insert(0, pipeline.job_url)
-                if pipeline.location:
-                    self._location_entry.insert(0, pipeline.location)
-                if pipeline.remote_policy:
-                    self._remote_dropdown.set(pipeline.remote_policy)
-                if pipeline.salary_range:
-                    self._salary_entry.insert(0, pipeline.salary_range)
-                self._priority_var.set(pipeline.priority)
-                if pipeline.notes:
-                    self._notes_text.insert("1.0", pipeline.notes)
+            return PipelineService(session).get_for_form(pipeline_id)
+
+    def _set_inputs_state(self, state: str):
+        """Enable or disable every input and the Save button."""
+        for widget in self._inputs:
+            widget.configure(state=state)
+
+    def _on_load_error(self, exc: BaseException):
+        """Report a failed pipeline load (Tk thread)."""
+        self._error_label.configure(text="Could not load pipeline")
+
+    def _apply_pipeline_data(self, pipeline: Optional[dict]):
+        """Fill the fields from a pipeline loaded for editing (Tk thread)."""
+        if pipeline is None:
+            self._error_label.configure(text="Pipeline not found")
+            return
+
+        self._set_inputs_state("normal")
+
+        self._company_entry.insert(0, pipeline["company"])
+        self._role_entry.insert(0, pipeline["role"])
+        if pipeline["job_url"]:
+            self._url_entry.insert(0, pipeline["job_url"])
+        if pipeline["location"]:
+            self._location_entry.insert(0, pipeline["location"])
+        if pipeline["remote_policy"]:
+            self._remote_dropdown.set(pipeline["remote_policy"])
+        if pipeline["salary_range"]:
+            self._salary_entry.insert(0, pipeline["salary_range"])
+        self._priority_selector.set(Priority.from_int(pipeline["priority"]).display_name)
+        if pipeline["notes"]:
+            self._notes_text.insert("1.0", pipeline["notes"])
 
     def _on_save_click(self):
         """Handle save button click."""
+        # Ignore repeat clicks while a save is in flight
+        if self._saving:
+            return
+
         # Validate
-        company = self._company_entry.get().strip()
-        role = self._role_entry.get().strip()
+        company = entry_text(self._company_entry)
+        role = entry_text(self._role_entry)
 
         if not company:
             self._error_label.configure(text="Company is required")
@@ -239,14 +300,39 @@ class PipelineFormDialog(ctk.CTkToplevel):
             return
 
         # Gather data
-        url = self._url_entry.get().strip() or None
-        location = self._location_entry.get().strip() or None
+        url = entry_text(self._url_entry)
+        location = entry_text(self._location_entry)
         remote = self._remote_dropdown.get()
         if remote == "Not specified":
             remote = None
-        salary = self._salary_entry.get().strip() or None
-        priority = self._priority_var.get()
-        notes = self._notes_text.get("1.0", "end-1c").strip() or None
+        salary = entry_text(self._salary_entry)
+        priority = _PRIORITY_BY_NAME[self._priority_selector.get()]
+        notes = textbox_text(self._notes_text)
+
+        fields = dict(
+            company=company,
+            role=role,
+            job_url=url,
+            location=location,
+            remote_policy=remote,
+            salary_range=salary,
+            priority=priority,
+            notes=notes,
+        )
+
+        # Disable Save for this attempt; the write runs once the disabled
+        # button has been drawn
+        self._saving = True
+        self._save_btn.configure(state="disabled")
+        self.after_idle(self._save, fields)
+
+    def _save(self, fields: dict):
+        """Write the pipeline, then close; re-enable Save if it fails."""
+        # Cancelled before the write started
+        if not self.winfo_exists():
+            return
+
+        from ...core.schemas import PipelineCreate, PipelineUpdate
 
         db = get_db()
 
@@ -255,27 +341,9 @@ class PipelineFormDialog(ctk.CTkToplevel):
                 service = PipelineService(session)
 
                 if self._is_edit:
-                    service.update(self._pipeline_id, PipelineUpdate(
-                        company=company,
-                        role=role,
-                        job_url=url,
-                        location=location,
-                        remote_policy=remote,
-                        salary_range=salary,
-                        priority=priority,
-                        notes=notes,
-                    ))
+                    service.update(self._pipeline_id, PipelineUpdate(**fields))
                 else:
-                    service.create(PipelineCreate(
-                        company=company,
-                        role=role,
-                        job_url=url,
-                        location=location,
-                        remote_policy=remote,
-                        salary_range=salary,
-                        priority=priority,
-                        notes=notes,
-                    ))
+                    service.create(PipelineCreate(**fields))
 
             if self._on_save:
                 self._on_save()
@@ -283,3 +351,5 @@ class PipelineFormDialog(ctk.CTkToplevel):
 
         except Exception as e:
             self._error_label.configure(text=f"Error: {str(e)}")
+            self._saving = False
+            self._save_btn.configure(state="normal")
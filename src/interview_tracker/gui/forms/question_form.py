@@ -1,14 +1,48 @@
 """Question form dialog for adding/editing questions."""
 
+import re
+
 import customtkinter as ctk
 from typing import Callable, Optional
 
+from ..async_runner import run_db, call_when_done
 from ..theme import Colors, Fonts, Spacing, Dimensions
-from ...core.schemas import QuestionCreate, QuestionUpdate
+from .fields import entry_text, textbox_text
 from ...core.enums import QuestionType
 from ...services.questions import QuestionService
 from ...data.database import get_db
 
+# Fixed dialog size; also used to center it without measuring widgets
+_DIALOG_WIDTH = 550
+_DIALOG_HEIGHT = 650
+
+# Font tuples shared by every widget in this module
+_FONT_NORMAL = Fonts.get("normal")
+_FONT_SMALL = Fonts.get("small")
+_FONT_LARGE_BOLD = Fonts.get("large", "bold")
+
+# Keyword arguments shared by the entries and text boxes in this module
+_ENTRY_KW = {
+    "font": _FONT_NORMAL,
+    "height": Dimensions.INPUT_HEIGHT,
+    "corner_radius": Dimensions.INPUT_CORNER_RADIUS,
+}
+_TEXTBOX_KW = {
+    "font": _FONT_NORMAL,
+    "corner_radius": Dimensions.INPUT_CORNER_RADIUS,
+}
+
+# Question type dropdown options and their reverse lookup, built once per process
+_TYPE_OPTIONS = tuple(qt.display_name for qt in QuestionType)
+_TYPE_BY_NAME = {qt.display_name: qt for qt in QuestionType}
+
+# Self-rating segments in order, and the stored rating each one stands for
+_RATING_OPTIONS = ("1", "2", "3", "4", "5", "N/A")
+_RATING_BY_NAME = {"1": 1, "2": 2, "3": 3, "4": 4, "5": 5, "N/A": None}
+
+# Comma separator for the tags field, swallowing the spaces around it
+_COMMA_SPLIT_RE = re.compile(r"\s*,\s*")
+
 
 class QuestionFormDialog(ctk.CTkToplevel):
     """Dialog for adding or editing a question."""
@@ -27,36 +61,47 @@ class QuestionFormDialog(ctk.CTkToplevel):
         self._interview_id = interview_id
         self._on_save = on_save
         self._is_edit = question_id is not None
+        self._saving = False
 
         self.title("Edit Question" if self._is_edit else "Add Question")
-        self.geometry("550x650")
         self.resizable(False, False)
 
+        # Center on parent from the fixed size, without measuring widgets
+        x = master.winfo_x() + (master.winfo_width() - _DIALOG_WIDTH) // 2
+        y = master.winfo_y() + (master.winfo_height() - _DIALOG_HEIGHT) // 2
+        self.geometry(f"{_DIALOG_WIDTH}x{_DIALOG_HEIGHT}+{x}+{y}")
+
         # Make modal
         self.transient(master)
         self.grab_set()
 
+        # Build the form once the window is mapped, so the empty dialog
+        # appears first instead of after every widget is constructed
+        self._map_binding = self.bind("<Map>", self._on_first_map, add="+")
+
+    def _on_first_map(self, event):
+        """Build and fill the form the first time the dialog is mapped."""
+        # Child widgets share the toplevel's bindings; only react to the window
+        if event.widget is not self:
+            return
+        self.unbind("<Map>", self._map_binding)
+
         self._create_widgets()
 
         if self._is_edit:
+            # Nothing can be typed or saved until the question has filled the form
+            self._set_inputs_state("disabled")
             self._load_question()
 
-        # Center on parent
-        self.update_idletasks()
-        x = master.winfo_x() + (master.winfo_width() - self.winfo_width()) // 2
-        y = master.winfo_y() + (master.winfo_height() - self.winfo_height()) // 2
-        self.geometry(f"+{x}+{y}")
-
     def _create_widgets(self):
         """Create form widgets."""
         main_frame = ctk.CTkFrame(self, fg_color="transparent")
-        main_frame.pack(fill="both", expand=True, padx=Spacing.PADDING_LARGE, pady=Spacing.PADDING_LARGE)
 
         # Title
         title = ctk.CTkLabel(
             main_frame,
             text="Edit Question" if self._is_edit else "Add Question",
-            font=Fonts.get("large", "bold"),
+            font=_FONT_LARGE_BOLD,
             text_color=Colors.TEXT_PRIMARY,
         )
         title.pack(anchor="w", pady=(0, Spacing.PADDING_LARGE))
@@ -69,19 +114,17 @@ class QuestionFormDialog(ctk.CTkToplevel):
         self._add_field(form_frame, "Question *")
         self._question_text = ctk.CTkTextbox(
             form_frame,
-            font=Fonts.get("normal"),
             height=80,
-            corner_radius=Dimensions.INPUT_CORNER_RADIUS,
+            **_TEXTBOX_KW,
         )
         self._question_text.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
 
         # Question type
         self._add_field(form_frame, "Question Type")
-        type_options = [qt.display_name for qt in QuestionType]
         self._type_dropdown = ctk.CTkOptionMenu(
             form_frame,
-            values=type_options,
-            font=Fonts.get("normal"),
+            values=_TYPE_OPTIONS,
+            font=_FONT_NORMAL,
             fg_color=Colors.BG_CARD,
             button_color=Colors.PRIMARY,
             height=Dimensions.INPUT_HEIGHT,
@@ -92,9 +135,8 @@ class QuestionFormDialog(ctk.CTkToplevel):
         self._add_field(form_frame, "My Answer")
         self._answer_text = ctk.CTkTextbox(
             form_frame,
-            font=Fonts.get("normal"),
             height=100,
-            corner_radius=Dimensions.INPUT_CORNER_RADIUS,
+            **_TEXTBOX_KW,
         )
         self._answer_text.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
 
@@ -102,45 +144,27 @@ class QuestionFormDialog(ctk.CTkToplevel):
         self._add_field(form_frame, "Ideal / Expected Answer")
         self._ideal_text = ctk.CTkTextbox(
             form_frame,
-            font=Fonts.get("normal"),
             height=100,
-            corner_radius=Dimensions.INPUT_CORNER_RADIUS,
+            **_TEXTBOX_KW,
         )
         self._ideal_text.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
 
         # Self-rating
         self._add_field(form_frame, "Self Rating (1-5)")
-        rating_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
-        rating_frame.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
-
-        self._rating_var = ctk.IntVar(value=0)
-        for i in range(1, 6):
-            rb = ctk.CTkRadioButton(
-                rating_frame,
-                text=str(i),
-                variable=self._rating_var,
-                value=i,
-                font=Fonts.get("normal"),
-            )
-            rb.pack(side="left", padx=Spacing.PADDING_SMALL)
-
-        # None option for rating
-        none_rb = ctk.CTkRadioButton(
-            rating_frame,
-            text="N/A",
-            variable=self._rating_var,
-            value=0,
-            font=Fonts.get("normal"),
+        self._rating_selector = ctk.CTkSegmentedButton(
+            form_frame,
+            values=_RATING_OPTIONS,
+            font=_FONT_NORMAL,
         )
-        none_rb.pack(side="left", padx=Spacing.PADDING_SMALL)
+        self._rating_selector.set("N/A")
+        self._rating_selector.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
 
         # Gap identified
         self._add_field(form_frame, "Gap Identified")
         self._gap_text = ctk.CTkTextbox(
             form_frame,
-            font=Fonts.get("normal"),
             height=60,
-            corner_radius=Dimensions.INPUT_CORNER_RADIUS,
+            **_TEXTBOX_KW,
         )
         self._gap_text.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
 
@@ -148,9 +172,7 @@ class QuestionFormDialog(ctk.CTkToplevel):
         self._add_field(form_frame, "Action Item")
         self._action_entry = ctk.CTkEntry(
             form_frame,
-            font=Fonts.get("normal"),
-            height=Dimensions.INPUT_HEIGHT,
-            corner_radius=Dimensions.INPUT_CORNER_RADIUS,
+            **_ENTRY_KW,
             placeholder_text="What will you do to improve?",
         )
         self._action_entry.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
@@ -159,9 +181,7 @@ class QuestionFormDialog(ctk.CTkToplevel):
         self._add_field(form_frame, "Tags (comma-separated)")
         self._tags_entry = ctk.CTkEntry(
             form_frame,
-            font=Fonts.get("normal"),
-            height=Dimensions.INPUT_HEIGHT,
-            corner_radius=Dimensions.INPUT_CORNER_RADIUS,
+            **_ENTRY_KW,
             placeholder_text="e.g., algorithms, dynamic-programming, graphs",
         )
         self._tags_entry.pack(fill="x", pady=(0, Spacing.PADDING_NORMAL))
@@ -170,7 +190,7 @@ class QuestionFormDialog(ctk.CTkToplevel):
         self._error_label = ctk.CTkLabel(
             main_frame,
             text="",
-            font=Fonts.get("normal"),
+            font=_FONT_NORMAL,
             text_color=Colors.DANGER,
         )
         self._error_label.pack(pady=(Spacing.PADDING_SMALL, 0))
@@ -182,7 +202,7 @@ class QuestionFormDialog(ctk.CTkToplevel):
         cancel_btn = ctk.CTkButton(
             button_frame,
             text="Cancel",
-            font=Fonts.get("normal"),
+            font=_FONT_NORMAL,
             fg_color="transparent",
             text_color=Colors.TEXT_SECONDARY,
             hover_color=Colors.BG_LIGHT,
@@ -191,80 +211,140 @@ class QuestionFormDialog(ctk.CTkToplevel):
         )
         cancel_btn.pack(side="left")
 
-        save_btn = ctk.CTkButton(
+        self._save_btn = ctk.CTkButton(
             button_frame,
             text="Save",
-            font=Fonts.get("normal"),
+            font=_FONT_NORMAL,
             fg_color=Colors.PRIMARY,
             hover_color=Colors.PRIMARY_HOVER,
             height=Dimensions.BUTTON_HEIGHT,
             command=self._on_save_click,
         )
-        save_btn.pack(side="right")
+        self._save_btn.pack(side="right")
+
+        # Everything _set_inputs_state toggles while an edit loads
+        self._inputs = (
+            self._question_text, self._type_dropdown, self._answer_text,
+            self._ideal_text, self._rating_selector, self._gap_text,
+            self._action_entry, self._tags_entry, self._save_btn,
+        )
+
+        # Pack the container last so the finished form is laid out and
+        # drawn in one pass rather than reflowing as each field is added
+        main_frame.pack(fill="both", expand=True, padx=Spacing.PADDING_LARGE, pady=Spacing.PADDING_LARGE)
 
     def _add_field(self, parent, label: str):
         """Add a field label."""
         label_widget = ctk.CTkLabel(
             parent,
             text=label,
-            font=Fonts.get("small"),
+            font=_FONT_SMALL,
             text_color=Colors.TEXT_MUTED,
         )
         label_widget.pack(anchor="w")
 
     def _load_question(self):
-        """Load existing question data for editing."""
+        """Load existing question data for editing off the Tk thread."""
+        call_when_done(
+            self,
+            run_db(self._fetch_question, self._question_id),
+            self._apply_question_data,
+            on_error=self._on_load_error,
+        )
+
+    @staticmethod
+    def _fetch_question(question_id: int) -> Optional[dict]:
+        """Read the question into a plain dict (worker thread)."""
         db = get_db()
 
         with db.session_scope() as session:
-            service = QuestionService(session)
-            question = service.get(self._question_id)
-
-            if question:
-                self._question_text.insert("1.0", question.question_text)
-
-                qtype = QuestionType(question.question_type)
-                self._type_dropdown.set(qtype.display_name)
-
-                if question.my_answer:
-                    self._answer_text.insert("1.0", question.my_answer)
-                if question.ideal_answer:
-                    self._ideal_text.insert("1.0", question.ideal_answer)
-                if question.rating:
-                    self._rating_var.set(question.rating)
-                if question.gap_identified:
-                    self._gap_text.insert("1.0", question.gap_identified)
-                if question.action_item:
-                    self._action_entry.insert(0, question.action_item)
-                if question.tags:
-                    self._tags_entry.insert(0, ", ".join(question.tags))
+            return QuestionService(session).get_for_form(question_id)
+
+    def _set_inputs_state(self, state: str):
+        """Enable or disable every input and the Save button."""
+        for widget in self._inputs:
+            widget.configure(state=state)
+
+    def _on_load_error(self, exc: BaseException):
+        """Report a failed question load (Tk thread)."""
+        self._error_label.configure(text="Could not load question")
+
+    def _apply_question_data(self, question: Optional[dict]):
+        """Fill the fields from a question loaded for editing (Tk thread)."""
+        if question is None:
+            self._error_label.configure(text="Question not found")
+            return
+
+        self._set_inputs_state("normal")
+
+        self._question_text.insert("1.0", question["question_text"])
+
+        qtype = QuestionType(question["question_type"])
+        self._type_dropdown.set(qtype.display_name)
+
+        if question["my_answer"]:
+            self._answer_text.insert("1.0", question["my_answer"])
+        if question["ideal_answer"]:
+            self._ideal_text.insert("1.0", question["ideal_answer"])
+        if question["rating"]:
+            self._rating_selector.set(str(question["rating"]))
+        if question["gap_identified"]:
+            self._gap_text.insert("1.0", question["gap_identified"])
+        if question["action_item"]:
+            self._action_entry.insert(0, question["action_item"])
+        if question["tags"]:
+            self._tags_entry.insert(0, ", ".join(question["tags"]))
 
     def _on_save_click(self):
         """Handle save button click."""
+        # Ignore repeat clicks while a save is in flight
+        if self._saving:
+            return
+
         # Validate
-        question_text = self._question_text.get("1.0", "end-1c").strip()
+        question_text = textbox_text(self._question_text)
 
         if not question_text:
             self._error_label.configure(text="Question text is required")
             return
 
         # Get question type
-        type_name = self._type_dropdown.get()
-        question_type = QuestionType.OTHER
-        for qt in QuestionType:
-            if qt.display_name == type_name:
-                question_type = qt
-                break
+        question_type = _TYPE_BY_NAME.get(self._type_dropdown.get(), QuestionType.OTHER)
 
         # Get other values
-        my_answer = self._answer_text.get("1.0", "end-1c").strip() or None
-        ideal_answer = self._ideal_text.get("1.0", "end-1c").strip() or None
-        rating = self._rating_var.get() if self._rating_var.get() > 0 else None
-        gap = self._gap_text.get("1.0", "end-1c").strip() or None
-        action = self._action_entry.get().strip() or None
+        my_answer = textbox_text(self._answer_text)
+        ideal_answer = textbox_text(self._ideal_text)
+        rating = _RATING_BY_NAME.get(self._rating_selector.get())
+        gap = textbox_text(self._gap_text)
+        action = entry_text(self._action_entry)
 
         tags_str = self._tags_entry.get().strip()
-        tags = [t.strip() for t in tags_str.split(",") if t.strip()] if tags_str else None
+        tags = [t for t in _COMMA_SPLIT_RE.split(tags_str) if t] or None
+
+        fields = dict(
+            question_text=question_text,
+            question_type=question_type,
+            my_answer=my_answer,
+            ideal_answer=ideal_answer,
+            rating=rating,
+            gap_identified=gap,
+            action_item=action,
+            tags=tags,
+        )
+
+        # Disable Save for this attempt; the write runs once the disabled
+        # button has been drawn
+        self._saving = True
+        self._save_btn.configure(state="disabled")
+        self.after_idle(self._save, fields)
+
+    def _save(self, fields: dict):
+        """Write the question, then close; re-enable Save if it fails."""
+        # Cancelled before the write started
+        if not self.winfo_exists():
+            return
+
+        from ...core.schemas import QuestionCreate, QuestionUpdate
 
         db = get_db()
 
@@ -273,28 +353,9 @@ class QuestionFormDialog(ctk.CTkToplevel):
                 service = QuestionService(session)
 
                 if self._is_edit:
-                    service.update(self._question_id, QuestionUpdate(
-                        question_text=question_text,
-                        question_type=question_type,
-                        my_answer=my_answer,
-                        ideal_answer=ideal_answer,
-                        rating=rating,
-                        gap_identified=gap,
-                        action_item=action,
-                        tags=tags,
-                    ))
+                    service.update(self._question_id, QuestionUpdate(**fields))
                 else:
-                    service.create(QuestionCreate(
-                        interview_id=self._interview_id,
-                        question_text=question_text,
-                        question_type=question_type,
-                        my_answer=my_answer,
-                        ideal_answer=ideal_answer,
-                        rating=rating,
-                        gap_identified=gap,
-                        action_item=action,
-                        tags=tags,
-                    ))
+                    service.create(QuestionCreate(interview_id=self._interview_id, **fields))
 
             if self._on_save:
                 self._on_save()
@@ -302,3 +363,5 @@ class QuestionFormDialog(ctk.CTkToplevel):
 
         except Exception as e:
             self._error_label.configure(text=f"Error: {str(e)}")
+            self._saving = False
+            self._save_btn.configure(state="normal")
@@ -1,11 +1,18 @@
 """Theme and styling configuration for the GUI."""
 
-import customtkinter as ctk
+from functools import lru_cache
 
 
-# Set appearance mode and color theme
-ctk.set_appearance_mode("dark")
-ctk.set_default_color_theme("blue")
+def configure_theme():
+    """
+    Set the CustomTkinter appearance mode and color theme.
+
+    Call once at startup, before the first window is created.
+    """
+    import customtkinter as ctk
+
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
 
 
 class Colors:
@@ -77,18 +84,20 @@ class Fonts:
     SIZE_XLARGE = 24
     SIZE_TITLE = 32
 
+    _SIZES = {
+        "small": SIZE_SMALL,
+        "normal": SIZE_NORMAL,
+        "medium": SIZE_MEDIUM,
+        "large": SIZE_LARGE,
+        "xlarge": SIZE_XLARGE,
+        "title": SIZE_TITLE,
+    }
+
     @classmethod
+    @lru_cache(maxsize=64)
     def get(cls, size: str = "normal", weight: str = "normal") -> tuple:
-        """Get a font tuple for CustomTkinter."""
-        sizes = {
-            "small": cls.SIZE_SMALL,
-            "normal": cls.SIZE_NORMAL,
-            "medium": cls.SIZE_MEDIUM,
-            "large": cls.SIZE_LARGE,
-            "xlarge": cls.SIZE_XLARGE,
-            "title": cls.SIZE_TITLE,
-        }
-        return (cls.FAMILY, sizes.get(size, cls.SIZE_NORMAL), weight)
+        """Get a font tuple for CustomTkinter (cached per size and weight)."""
+        return (cls.FAMILY, cls._SIZES.get(size, cls.SIZE_NORMAL), weight)
 
 
 class Spacing:
@@ -137,46 +146,57 @@ class Dimensions:
     TABLE_HEADER_HEIGHT = 45
 
 
+_HEALTH_COLORS = {
+    "active": Colors.HEALTH_ACTIVE,
+    "awaiting": Colors.HEALTH_AWAITING,
+    "needs_followup": Colors.HEALTH_FOLLOWUP,
+    "stale": Colors.HEALTH_STALE,
+    "closed": Colors.HEALTH_CLOSED,
+}
+
+
 def get_health_color(health_value: str) -> str:
     """Get the color for a pipeline health status."""
-    colors = {
-        "active": Colors.HEALTH_ACTIVE,
-        "awaiting": Colors.HEALTH_AWAITING,
-        "needs_followup": Colors.HEALTH_FOLLOWUP,
-        "stale": Colors.HEALTH_STALE,
-        "closed": Colors.HEALTH_CLOSED,
-    }
-    return colors.get(health_value, Colors.TEXT_MUTED)
+    return _HEALTH_COLORS.get(health_value, Colors.TEXT_MUTED)
+
+
+_PREP_COLORS = {
+    "not_started": Colors.PREP_NOT_STARTED,
+    "in_progress": Colors.PREP_IN_PROGRESS,
+    "ready": Colors.PREP_READY,
+}
 
 
 def get_prep_color(prep_status: str) -> str:
     """Get the color for a preparation status."""
-    colors = {
-        "not_started": Colors.PREP_NOT_STARTED,
-        "in_progress": Colors.PREP_IN_PROGRESS,
-        "ready": Colors.PREP_READY,
-    }
-    return colors.get(prep_status, Colors.TEXT_MUTED)
+    return _PREP_COLORS.get(prep_status, Colors.TEXT_MUTED)
+
+
+_PRIORITY_COLORS = (
+    Colors.TEXT_MUTED,
+    Colors.PRIORITY_LOW,
+    Colors.PRIORITY_MEDIUM,
+    Colors.PRIORITY_HIGH,
+    Colors.PRIORITY_VERY_HIGH,
+    Colors.PRIORITY_CRITICAL,
+)
 
 
 def get_priority_color(priority: int) -> str:
     """Get the color for a priority level."""
-    colors = {
-        1: Colors.PRIORITY_LOW,
-        2: Colors.PRIORITY_MEDIUM,
-        3: Colors.PRIORITY_HIGH,
-        4: Colors.PRIORITY_VERY_HIGH,
-        5: Colors.PRIORITY_CRITICAL,
-    }
-    return colors.get(priority, Colors.TEXT_MUTED)
+    if isinstance(priority, int) and 1 <= priority <= 5:
+        return _PRIORITY_COLORS[priority]
+    return Colors.TEXT_MUTED
+
+
+_OUTCOME_COLORS = {
+    "pending": Colors.WARNING,
+    "passed": Colors.SUCCESS,
+    "failed": Colors.DANGER,
+    "rescheduled": Colors.INFO,
+}
 
 
 def get_outcome_color(outcome: str) -> str:
     """Get the color for an interview outcome."""
-    colors = {
-        "pending": Colors.WARNING,
-        "passed": Colors.SUCCESS,
-        "failed": Colors.DANGER,
-        "rescheduled": Colors.INFO,
-    }
-    return colors.get(outcome, Colors.TEXT_MUTED)
+    return _OUTCOME_COLORS.get(outcome, Colors.TEXT_MUTED)
@@ -2,17 +2,22 @@
 
 import customtkinter as ctk
 from datetime import datetime
+from functools import partial
 from typing import Callable, Optional
 
+from ..async_runner import run_db, call_when_done
+from ..formatting import truncate, short_datetime
 from ..theme import Colors, Fonts, Spacing, Dimensions, get_health_color, get_prep_color
 from ..components.metrics_card import MetricsRow
-from ..components.data_table import DataTable, StatusBadge
+from ..components.data_table import DataTable
 from ...services.metrics import MetricsService
-from ...services.pipeline import PipelineService
-from ...services.interview import InterviewService
-from ...core.enums import PipelineStage, PrepStatus, PipelineHealth
+from ...services.query_cache import get_cached
+from ...core.enums import STAGE_DISPLAY
 from ...data.database import get_db
 
+# Seconds a dashboard snapshot is reused; any database write drops it sooner
+DASHBOARD_CACHE_TTL = 30.0
+
 
 class DashboardView(ctk.CTkFrame):
     """Main dashboard view."""
@@ -32,6 +37,8 @@ class DashboardView(ctk.CTkFrame):
         self._on_view_interview = on_view_interview
         self._on_add_pipeline = on_add_pipeline
         self._on_schedule_interview = on_schedule_interview
+        # Bumped per refresh so an older, slower load cannot overwrite a newer one
+        self._refresh_generation = 0
 
         self._create_widgets()
         self.refresh()
@@ -134,7 +141,7 @@ class DashboardView(ctk.CTkFrame):
                 {"key": "stage", "title": "Stage", "width": 100},
                 {"key": "date", "title": "Date", "width": 100},
                 {"key": "prep_status", "title": "Prep", "width": 80,
-                 "render": self._render_prep_status},
+                 "badge": self._badge_for_prep},
             ],
             on_row_double_click=self._on_interview_double_click,
         )
@@ -159,24 +166,20 @@ class DashboardView(ctk.CTkFrame):
                 {"key": "company", "title": "Company", "width": 120},
                 {"key": "role", "title": "Role", "width": 120},
                 {"key": "health", "title": "Status", "width": 100,
-                 "render": self._render_health_status},
+                 "badge": self._badge_for_health},
                 {"key": "reason", "title": "Reason", "width": 150},
             ],
             on_row_double_click=self._on_pipeline_double_click,
         )
         self._attention_table.pack(fill="both", expand=True)
 
-    def _render_prep_status(self, parent, value, row_data):
-        """Render preparation status as a colored badge."""
-        color = get_prep_color(value)
-        text = value.replace("_", " ").title()
-        return StatusBadge(parent, text=text, color=color)
+    def _badge_for_prep(self, value):
+        """Badge text and color for a preparation status."""
+        return value.replace("_", " ").title(), get_prep_color(value)
 
-    def _render_health_status(self, parent, value, row_data):
-        """Render health status as a colored badge."""
-        color = get_health_color(value)
-        text = value.replace("_", " ").title()
-        return StatusBadge(parent, text=text, color=color)
+    def _badge_for_health(self, value):
+        """Badge text and color for a health status."""
+        return value.replace("_", " ").title(), get_health_color(value)
 
     def _on_add_pipeline_click(self):
         """Handle add pipeline button click."""
@@ -199,44 +202,56 @@ class DashboardView(ctk.CTkFrame):
             self._on_view_pipeline(row_data["id"])
 
     def refresh(self):
-        """Refresh dashboard data."""
+        """Refresh dashboard data. The queries run on a worker thread."""
+        self._refresh_generation += 1
+        call_when_done(
+            self,
+            run_db(get_cached, ("dashboard",), DASHBOARD_CACHE_TTL, self._load_data),
+            partial(self._apply_data, self._refresh_generation),
+        )
+
+    def _apply_data(self, generation: int, data):
+        """Show loaded dashboard data (Tk thread)."""
+        if generation != self._refresh_generation:
+            return
+
+        metrics, interviews_data, attention_data = data
+
+        self._metrics_row.update_card("active", str(metrics.total_active_pipelines))
+        self._metrics_row.update_card("pass_rate", f"{metrics.pass_rate}%")
+        self._metrics_row.update_card("follow_ups", str(metrics.pending_follow_ups))
+        self._metrics_row.update_card("offers", str(metrics.offers_received))
+
+        self._interviews_table.apply_diff(interviews_data)
+        self._attention_table.apply_diff(attention_data)
+
+    def _load_data(self):
+        """Query the metrics and both tables' rows as plain data (worker thread)."""
         db = get_db()
 
         with db.session_scope() as session:
-            metrics_service = MetricsService(session)
-            pipeline_service = PipelineService(session)
-            interview_service = InterviewService(session)
-
-            # Update metrics
-            metrics = metrics_service.get_dashboard_metrics()
-            self._metrics_row.update_card("active", str(metrics.total_active_pipelines))
-            self._metrics_row.update_card("pass_rate", f"{metrics.pass_rate}%")
-            self._metrics_row.update_card("follow_ups", str(metrics.pending_follow_ups))
-            self._metrics_row.update_card("offers", str(metrics.offers_received))
-
-            # Update upcoming interviews
-            upcoming = metrics_service.get_upcoming_interviews(limit=10)
+            snapshot = MetricsService(session).get_dashboard_snapshot(limit=10)
+
+            # Upcoming interviews
             interviews_data = []
-            for interview in upcoming:
-                stage_enum = PipelineStage(interview.stage)
+            for interview in snapshot.upcoming:
                 interviews_data.append({
                     "id": interview.id,
                     "company": interview.company,
-                    "stage": stage_enum.display_name,
-                    "date": interview.scheduled_date.strftime("%b %d, %H:%M"),
+                    "stage": STAGE_DISPLAY[interview.stage],
+                    "date": short_datetime(interview.scheduled_date),
                     "prep_status": interview.prep_status,
                 })
-            self._interviews_table.set_data(interviews_data)
 
-            # Update pipelines needing attention
-            attention = metrics_service.get_pipelines_needing_attention(limit=10)
+            # Pipelines needing attention
             attention_data = []
-            for item in attention:
+            for item in snapshot.attention:
                 attention_data.append({
                     "id": item.id,
                     "company": item.company,
-                    "role": item.role[:20] + "..." if len(item.role) > 20 else item.role,
+                    "role": truncate(item.role, 20),
                     "health": item.health.value,
                     "reason": item.reason,
                 })
-            self._attention_table.set_data(attention_data)
+
+        return snapshot.metrics, interviews_data, attention_data
@@ -2,14 +2,21 @@
 
 import customtkinter as ctk
 from datetime import datetime
+from functools import partial
 from typing import Callable, Optional
 
+from ..async_runner import run_db, call_when_done
+from ..formatting import truncate, short_datetime, long_datetime
 from ..theme import Colors, Fonts, Spacing, Dimensions, get_prep_color, get_outcome_color
-from ..components.data_table import DataTable, StatusBadge
+from ..components.data_table import DataTable
 from ...services.interview import InterviewService
-from ...core.enums import PipelineStage, InterviewOutcome, PrepStatus, InterviewMode
+from ...services.query_cache import get_cached
+from ...core.enums import InterviewOutcome, STAGE_DISPLAY, MODE_DISPLAY, OUTCOME_DISPLAY, PREP_DISPLAY
 from ...data.database import get_db
 
+# Seconds a filter's rows are reused; any database write drops them sooner
+INTERVIEW_LIST_CACHE_TTL = 30.0
+
 
 class InterviewListView(ctk.CTkFrame):
     """View for listing all interviews."""
@@ -26,6 +33,10 @@ class InterviewListView(ctk.CTkFrame):
         self._on_view_interview = on_view_interview
         self._on_schedule_interview = on_schedule_interview
         self._filter_mode = "upcoming"  # "upcoming", "pending", "all"
+        # Bumped per refresh so an older, slower load cannot overwrite a newer one
+        self._refresh_generation = 0
+        # Filter whose rows the table holds; None until the first load
+        self._shown_filter: Optional[str] = None
 
         self._create_widgets()
         self.refresh()
@@ -93,25 +104,21 @@ class InterviewListView(ctk.CTkFrame):
                 {"key": "date", "title": "Date", "width": 120},
                 {"key": "mode", "title": "Mode", "width": 80},
                 {"key": "prep_status", "title": "Prep", "width": 90,
-                 "render": self._render_prep_status},
+                 "badge": self._badge_for_prep},
                 {"key": "outcome", "title": "Outcome", "width": 90,
-                 "render": self._render_outcome},
+                 "badge": self._badge_for_outcome},
             ],
             on_row_double_click=self._on_row_double_click,
         )
         self._table.pack(fill="both", expand=True, padx=Spacing.PADDING_LARGE, pady=(0, Spacing.PADDING_LARGE))
 
-    def _render_prep_status(self, parent, value, row_data):
-        """Render prep status as colored badge."""
-        color = get_prep_color(value)
-        text = value.replace("_", " ").title()
-        return StatusBadge(parent, text=text, color=color)
+    def _badge_for_prep(self, value):
+        """Badge text and color for a preparation status."""
+        return value.replace("_", " ").title(), get_prep_color(value)
 
-    def _render_outcome(self, parent, value, row_data):
-        """Render outcome as colored badge."""
-        color = get_outcome_color(value)
-        text = value.replace("_", " ").title()
-        return StatusBadge(parent, text=text, color=color)
+    def _badge_for_outcome(self, value):
+        """Badge text and color for an interview outcome."""
+        return value.replace("_", " ").title(), get_outcome_color(value)
 
     def _on_schedule_click(self):
         if self._on_schedule_interview:
@@ -119,6 +126,8 @@ class InterviewListView(ctk.CTkFrame):
 
     def _on_filter_change(self, filter_id: str):
         """Handle filter change."""
+        if filter_id == self._filter_mode:
+            return
         self._filter_mode = filter_id
 
         # Update button styles
@@ -135,43 +144,65 @@ class InterviewListView(ctk.CTkFrame):
             self._on_view_interview(row_data["id"])
 
     def refresh(self):
-        """Refresh interview list."""
+        """
+        Refresh interview list. The query runs on a worker thread.
+
+        Rows are served from the query cache until it expires or a write
+        invalidates it, so repeated refreshes of unchanged data skip the query.
+        """
+        self._refresh_generation += 1
+        call_when_done(
+            self,
+            run_db(
+                get_cached, ("interviews", self._filter_mode),
+                INTERVIEW_LIST_CACHE_TTL, partial(self._load_rows, self._filter_mode),
+            ),
+            partial(self._apply_rows, self._refresh_generation, self._filter_mode),
+        )
+
+    def _apply_rows(self, generation: int, filter_mode: str, table_data: list):
+        """Show loaded rows (Tk thread)."""
+        if generation != self._refresh_generation:
+            return
+        # A new filter shows a different list, so rebuild rather than diff
+        if filter_mode != self._shown_filter:
+            self._shown_filter = filter_mode
+            self._table.set_data(table_data)
+        else:
+            self._table.apply_diff(table_data)
+
+    @staticmethod
+    def _load_rows(filter_mode: str) -> list:
+        """Query the interviews for a filter as table rows (worker thread)."""
         db = get_db()
 
         with db.session_scope() as session:
             interview_service = InterviewService(session)
 
-            if self._filter_mode == "upcoming":
+            if filter_mode == "upcoming":
                 interviews = interview_service.get_all_upcoming()
-            elif self._filter_mode == "pending":
+            elif filter_mode == "pending":
                 interviews = interview_service.get_pending_outcomes()
             else:
-                # Get all - using upcoming + pending + completed
-                from sqlalchemy import select
-                from ...core.models import Interview
-                stmt = select(Interview).order_by(Interview.scheduled_date.desc()).limit(100)
-                interviews = list(session.execute(stmt).scalars().all())
+                interviews = interview_service.get_recent(limit=100)
 
             table_data = []
             for interview in interviews:
                 pipeline = interview.pipeline
-                stage = PipelineStage(interview.stage)
-                mode = InterviewMode(interview.mode)
-
-                date_str = interview.scheduled_date.strftime("%b %d, %H:%M") if interview.scheduled_date else "-"
+                date_str = short_datetime(interview.scheduled_date) if interview.scheduled_date else "-"
 
                 table_data.append({
                     "id": interview.id,
                     "company": pipeline.company if pipeline else "-",
-                    "role": (pipeline.role[:20] + "...") if pipeline and len(pipeline.role) > 20 else (pipeline.role if pipeline else "-"),
-                    "stage": stage.display_name,
+                    "role": truncate(pipeline.role, 20) if pipeline else "-",
+                    "stage": STAGE_DISPLAY[interview.stage],
                     "date": date_str,
-                    "mode": mode.display_name,
+                    "mode": MODE_DISPLAY[interview.mode],
                     "prep_status": interview.prep_status,
                     "outcome": interview.outcome,
                 })
 
-            self._table.set_data(table_data)
+        return table_data
 
 
 class InterviewDetailView(ctk.CTkFrame):
@@ -194,8 +225,17 @@ class InterviewDetailView(ctk.CTkFrame):
         self._create_widgets()
         self.refresh()
 
+    def _text_var(self, key: str, text: str = "-") -> ctk.StringVar:
+        """Create the variable behind a refreshed label and register it under key."""
+        var = ctk.StringVar(self, value=text)
+        self._text_vars[key] = var
+        return var
+
     def _create_widgets(self):
         """Create detail view widgets."""
+        # Every text refresh() fills in, set through these rather than configure()
+        self._text_vars: dict[str, ctk.StringVar] = {}
+
         # Header
         header_frame = ctk.CTkFrame(self, fg_color="transparent")
         header_frame.pack(fill="x", padx=Spacing.PADDING_LARGE, pady=Spacing.PADDING_LARGE)
@@ -214,7 +254,7 @@ class InterviewDetailView(ctk.CTkFrame):
 
         self._title_label = ctk.CTkLabel(
             header_frame,
-            text="Interview Details",
+            textvariable=self._text_var("title", "Interview Details"),
             font=Fonts.get("title", "bold"),
             text_color=Colors.TEXT_PRIMARY,
         )
@@ -246,7 +286,6 @@ class InterviewDetailView(ctk.CTkFrame):
 
         # Content
         content = ctk.CTkScrollableFrame(self, fg_color="transparent")
-        content.pack(fill="both", expand=True, padx=Spacing.PADDING_LARGE)
 
         # Info card
         info_card = ctk.CTkFrame(content, fg_color=Colors.BG_CARD, corner_radius=Dimensions.CARD_CORNER_RADIUS)
@@ -254,8 +293,9 @@ class InterviewDetailView(ctk.CTkFrame):
 
         info_inner = ctk.CTkFrame(info_card, fg_color="transparent")
         info_inner.pack(fill="x", padx=Spacing.PADDING_LARGE, pady=Spacing.PADDING_LARGE)
+        info_inner.grid_columnconfigure(0, weight=1)
+        info_inner.grid_columnconfigure(1, weight=1)
 
-        self._info_labels = {}
         info_fields = [
             ("company", "Company"),
             ("role", "Role"),
@@ -284,15 +324,11 @@ class InterviewDetailView(ctk.CTkFrame):
 
             value_widget = ctk.CTkLabel(
                 field_frame,
-                text="-",
+                textvariable=self._text_var(key),
                 font=Fonts.get("normal"),
                 text_color=Colors.TEXT_PRIMARY,
             )
             value_widget.pack(anchor="w")
-            self._info_labels[key] = value_widget
-
-        info_inner.grid_columnconfigure(0, weight=1)
-        info_inner.grid_columnconfigure(1, weight=1)
 
         # Preparation card
         prep_card = ctk.CTkFrame(content, fg_color=Colors.BG_CARD, corner_radius=Dimensions.CARD_CORNER_RADIUS)
@@ -316,7 +352,7 @@ class InterviewDetailView(ctk.CTkFrame):
         ctk.CTkLabel(status_frame, text="Status:", font=Fonts.get("normal"), text_color=Colors.TEXT_SECONDARY).pack(side="left")
         self._prep_status_badge = ctk.CTkFrame(status_frame, fg_color=Colors.TEXT_MUTED, corner_radius=4)
         self._prep_status_badge.pack(side="left", padx=Spacing.PADDING_SMALL)
-        self._prep_status_label = ctk.CTkLabel(self._prep_status_badge, text="-", font=Fonts.get("small"))
+        self._prep_status_label = ctk.CTkLabel(self._prep_status_badge, textvariable=self._text_var("prep_status"), font=Fonts.get("small"))
         self._prep_status_label.pack(padx=Spacing.PADDING_SMALL, pady=2)
 
         # Confidence
@@ -324,13 +360,13 @@ class InterviewDetailView(ctk.CTkFrame):
         confidence_frame.pack(fill="x", pady=Spacing.PADDING_SMALL)
 
         ctk.CTkLabel(confidence_frame, text="Confidence:", font=Fonts.get("normal"), text_color=Colors.TEXT_SECONDARY).pack(side="left")
-        self._confidence_label = ctk.CTkLabel(confidence_frame, text="-", font=Fonts.get("normal"), text_color=Colors.TEXT_PRIMARY)
+        self._confidence_label = ctk.CTkLabel(confidence_frame, textvariable=self._text_var("confidence"), font=Fonts.get("normal"), text_color=Colors.TEXT_PRIMARY)
         self._confidence_label.pack(side="left", padx=Spacing.PADDING_SMALL)
 
         # Topics
         topics_label = ctk.CTkLabel(prep_inner, text="Topics to prepare:", font=Fonts.get("normal"), text_color=Colors.TEXT_SECONDARY)
         topics_label.pack(anchor="w", pady=(Spacing.PADDING_SMALL, 0))
-        self._topics_label = ctk.CTkLabel(prep_inner, text="-", font=Fonts.get("normal"), text_color=Colors.TEXT_PRIMARY, wraplength=500, justify="left")
+        self._topics_label = ctk.CTkLabel(prep_inner, textvariable=self._text_var("topics"), font=Fonts.get("normal"), text_color=Colors.TEXT_PRIMARY, wraplength=500, justify="left")
         self._topics_label.pack(anchor="w")
 
         # Outcome card
@@ -355,21 +391,25 @@ class InterviewDetailView(ctk.CTkFrame):
         ctk.CTkLabel(outcome_status_frame, text="Result:", font=Fonts.get("normal"), text_color=Colors.TEXT_SECONDARY).pack(side="left")
         self._outcome_badge = ctk.CTkFrame(outcome_status_frame, fg_color=Colors.TEXT_MUTED, corner_radius=4)
         self._outcome_badge.pack(side="left", padx=Spacing.PADDING_SMALL)
-        self._outcome_label = ctk.CTkLabel(self._outcome_badge, text="-", font=Fonts.get("small"))
+        self._outcome_label = ctk.CTkLabel(self._outcome_badge, textvariable=self._text_var("outcome"), font=Fonts.get("small"))
         self._outcome_label.pack(padx=Spacing.PADDING_SMALL, pady=2)
 
         # Feedback
         feedback_label = ctk.CTkLabel(outcome_inner, text="Feedback received:", font=Fonts.get("normal"), text_color=Colors.TEXT_SECONDARY)
         feedback_label.pack(anchor="w", pady=(Spacing.PADDING_SMALL, 0))
-        self._feedback_label = ctk.CTkLabel(outcome_inner, text="-", font=Fonts.get("normal"), text_color=Colors.TEXT_PRIMARY, wraplength=500, justify="left")
+        self._feedback_label = ctk.CTkLabel(outcome_inner, textvariable=self._text_var("feedback"), font=Fonts.get("normal"), text_color=Colors.TEXT_PRIMARY, wraplength=500, justify="left")
         self._feedback_label.pack(anchor="w")
 
         # Self assessment
         assess_label = ctk.CTkLabel(outcome_inner, text="Self assessment:", font=Fonts.get("normal"), text_color=Colors.TEXT_SECONDARY)
         assess_label.pack(anchor="w", pady=(Spacing.PADDING_SMALL, 0))
-        self._assessment_label = ctk.CTkLabel(outcome_inner, text="-", font=Fonts.get("normal"), text_color=Colors.TEXT_PRIMARY, wraplength=500, justify="left")
+        self._assessment_label = ctk.CTkLabel(outcome_inner, textvariable=self._text_var("assessment"), font=Fonts.get("normal"), text_color=Colors.TEXT_PRIMARY, wraplength=500, justify="left")
         self._assessment_label.pack(anchor="w")
 
+        # Pack the content last so the three finished cards are laid out and
+        # drawn in one pass rather than reflowing as each widget is added
+        content.pack(fill="both", expand=True, padx=Spacing.PADDING_LARGE)
+
     def _on_back_click(self):
         if self._on_back:
             self._on_back()
@@ -395,59 +435,44 @@ class InterviewDetailView(ctk.CTkFrame):
                 return
 
             pipeline = interview.pipeline
-            stage = PipelineStage(interview.stage)
-            mode = InterviewMode(interview.mode)
-            outcome = InterviewOutcome(interview.outcome)
-            prep_status = PrepStatus(interview.prep_status)
-
-            # Update title
+            stage_name = STAGE_DISPLAY[interview.stage]
             company = pipeline.company if pipeline else "Unknown"
-            self._title_label.configure(text=f"{company} - {stage.display_name}")
-
-            # Update info
-            self._info_labels["company"].configure(text=company)
-            self._info_labels["role"].configure(text=pipeline.role if pipeline else "-")
-            self._info_labels["stage"].configure(text=stage.display_name)
-            self._info_labels["date"].configure(
-                text=interview.scheduled_date.strftime("%B %d, %Y at %H:%M") if interview.scheduled_date else "-"
-            )
-            self._info_labels["mode"].configure(text=mode.display_name)
-            self._info_labels["duration"].configure(text=f"{interview.duration_minutes} minutes")
-            self._info_labels["interviewer"].configure(
-                text=f"{interview.interviewer_name or '-'}" +
-                     (f" ({interview.interviewer_title})" if interview.interviewer_title else "")
-            )
-            self._info_labels["meeting_link"].configure(
-                text=interview.meeting_link[:50] + "..." if interview.meeting_link and len(interview.meeting_link) > 50
-                else (interview.meeting_link or "-")
-            )
 
-            # Update prep status
-            prep_color = get_prep_color(interview.prep_status)
-            self._prep_status_badge.configure(fg_color=prep_color)
-            self._prep_status_label.configure(text=prep_status.display_name)
-
-            # Update confidence
             if interview.confidence:
                 stars = "\u2605" * interview.confidence + "\u2606" * (5 - interview.confidence)
-                self._confidence_label.configure(text=f"{stars} ({interview.confidence}/5)")
+                confidence = f"{stars} ({interview.confidence}/5)"
             else:
-                self._confidence_label.configure(text="Not rated")
-
-            # Update topics
+                confidence = "Not rated"
             topics = interview.topics
-            self._topics_label.configure(text=", ".join(topics) if topics else "No topics specified")
-
-            # Update outcome
-            outcome_color = get_outcome_color(interview.outcome)
-            self._outcome_badge.configure(fg_color=outcome_color)
-            self._outcome_label.configure(text=outcome.display_name)
 
-            self._feedback_label.configure(text=interview.feedback_received or "No feedback yet")
-            self._assessment_label.configure(text=interview.self_assessment or "No self-assessment")
+            texts = {
+                "title": f"{company} - {stage_name}",
+                "company": company,
+                "role": pipeline.role if pipeline else "-",
+                "stage": stage_name,
+                "date": long_datetime(interview.scheduled_date) if interview.scheduled_date else "-",
+                "mode": MODE_DISPLAY[interview.mode],
+                "duration": f"{interview.duration_minutes} minutes",
+                "interviewer": f"{interview.interviewer_name or '-'}" + (
+                    f" ({interview.interviewer_title})" if interview.interviewer_title else ""
+                ),
+                "meeting_link": truncate(interview.meeting_link, 50) if interview.meeting_link else "-",
+                "prep_status": PREP_DISPLAY[interview.prep_status],
+                "confidence": confidence,
+                "topics": ", ".join(topics) if topics else "No topics specified",
+                "outcome": OUTCOME_DISPLAY[interview.outcome],
+                "feedback": interview.feedback_received or "No feedback yet",
+                "assessment": interview.self_assessment or "No self-assessment",
+            }
+            for key, text in texts.items():
+                self._text_vars[key].set(text)
+
+            # Badge colors
+            self._prep_status_badge.configure(fg_color=get_prep_color(interview.prep_status))
+            self._outcome_badge.configure(fg_color=get_outcome_color(interview.outcome))
 
             # Update complete button state
-            if outcome != InterviewOutcome.PENDING:
+            if interview.outcome != InterviewOutcome.PENDING:
                 self._complete_btn.configure(state="disabled", text="Completed")
             else:
                 self._complete_btn.configure(state="normal", text="Mark Complete")
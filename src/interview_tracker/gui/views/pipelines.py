@@ -1,10 +1,11 @@
 """Pipeline list and detail views."""
 
 import customtkinter as ctk
-from datetime import datetime
+from datetime import datetime, date
 from typing import Callable, Optional, List
 
 from ..theme import Colors, Fonts, Spacing, Dimensions, get_health_color, get_priority_color
+from ..formatting import truncate, short_datetime
 from ..components.data_table import DataTable, StatusBadge
 from ...services.pipeline import PipelineService
 from ...core.enums import PipelineStage, PipelineHealth, Priority
@@ -158,7 +159,7 @@ class PipelineListView(ctk.CTkFrame):
         """Render priority as a colored badge."""
         color = get_priority_color(value)
         try:
-            priority = Priority(value)
+            priority = Priority.from_int(value)
             text = priority.display_name
         except:
             text = str(value)
@@ -201,17 +202,19 @@ class PipelineListView(ctk.CTkFrame):
             else:
                 pipelines = pipeline_service.get_all(include_closed=self._include_closed)
 
+            health_by_id = pipeline_service.get_health()
             table_data = []
+            today = date.today()
             for p in pipelines:
-                health = pipeline_service.calculate_health(p)
+                health = health_by_id[p.id]
                 table_data.append({
                     "id": p.id,
                     "company": p.company,
-                    "role": p.role[:30] + "..." if len(p.role) > 30 else p.role,
+                    "role": truncate(p.role, 30),
                     "stage": p.current_stage,
                     "health": health.value,
                     "priority": p.priority,
-                    "days_active": p.days_since_applied,
+                    "days_active": (today - p.applied_date).days,
                     "updated": p.updated_at.strftime("%b %d"),
                 })
 
@@ -436,7 +439,7 @@ class PipelineDetailView(ctk.CTkFrame):
 
             # Update info labels
             stage = PipelineStage(pipeline.current_stage)
-            health = pipeline_service.calculate_health(pipeline)
+            health = pipeline_service.get_health(pipeline.id)[pipeline.id]
 
             self._info_labels["company"].configure(text=pipeline.company)
             self._info_labels["role"].configure(text=pipeline.role)
@@ -510,7 +513,7 @@ class PipelineDetailView(ctk.CTkFrame):
                     )
                     stage_label.pack(side="left", padx=Spacing.PADDING_SMALL, pady=Spacing.PADDING_SMALL)
 
-                    date_text = interview.scheduled_date.strftime("%b %d, %H:%M") if interview.scheduled_date else "Not scheduled"
+                    date_text = short_datetime(interview.scheduled_date) if interview.scheduled_date else "Not scheduled"
                     date_label = ctk.CTkLabel(
                         interview_row,
                         text=date_text,
@@ -4,6 +4,7 @@ import customtkinter as ctk
 from typing import Callable, Optional
 
 from ..theme import Colors, Fonts, Spacing, Dimensions
+from ..formatting import truncate
 from ..components.data_table import DataTable, StatusBadge
 from ...services.questions import QuestionService
 from ...core.enums import QuestionType
@@ -236,13 +237,9 @@ class QuestionBankView(ctk.CTkFrame):
             # Update table
             table_data = []
             for q in questions:
-                question_text = q.question_text
-                if len(question_text) > 60:
-                    question_text = question_text[:60] + "..."
-
                 table_data.append({
                     "id": q.id,
-                    "question": question_text,
+                    "question": truncate(q.question_text, 60),
                     "type": q.question_type,
                     "rating": q.rating,
                     "has_gap": "\u2713" if q.gap_identified else "",
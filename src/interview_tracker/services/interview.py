@@ -130,6 +130,16 @@ class InterviewService:
         )
         return list(self.session.execute(stmt).unique().scalars().all())
 
+    def get_recent(self, limit: int = 100) -> List[Interview]:
+        """Get the most recently scheduled interviews with their pipelines loaded."""
+        stmt = (
+            select(Interview)
+            .options(joinedload(Interview.pipeline))
+            .order_by(Interview.scheduled_date.desc())
+            .limit(limit)
+        )
+        return list(self.session.execute(stmt).unique().scalars().all())
+
     def get_pending_outcomes(self) -> List[Interview]:
         """Get interviews that are done but have pending outcomes."""
         now = datetime.utcnow()
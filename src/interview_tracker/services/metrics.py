@@ -2,17 +2,28 @@
 
 from datetime import datetime, date, timedelta
 from typing import List, Optional
-from collections import Counter
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, case
 from sqlalchemy.orm import Session
 
 from ..core.models import Pipeline, Interview
-from ..core.schemas import DashboardMetrics, UpcomingInterview, PipelineAttention
-from ..core.enums import PipelineStage, InterviewOutcome, PipelineHealth
+from ..core.schemas import (
+    DashboardMetrics, DashboardSnapshot, UpcomingInterview, PipelineAttention
+)
+from ..core.enums import PipelineStage, InterviewOutcome
 from ..data.database import get_db
 from .pipeline import PipelineService
 
+_CLOSED_STAGES = frozenset({
+    PipelineStage.REJECTED.value,
+    PipelineStage.DROPPED.value,
+    PipelineStage.OFFER.value,
+})
+_DROPPED_OUT_STAGES = frozenset({
+    PipelineStage.REJECTED.value,
+    PipelineStage.DROPPED.value,
+})
+
 
 class MetricsService:
     """Service for calculating dashboard metrics."""
@@ -26,125 +37,89 @@ class MetricsService:
             self._session = get_db().get_session()
         return self._session
 
+    def get_dashboard_snapshot(self, limit: int = 10) -> DashboardSnapshot:
+        """Get the metrics, upcoming interviews and attention list in one call."""
+        return DashboardSnapshot(
+            metrics=self.get_dashboard_metrics(),
+            upcoming=self.get_upcoming_interviews(limit=limit),
+            attention=self.get_pipelines_needing_attention(limit=limit),
+        )
+
     def get_dashboard_metrics(self) -> DashboardMetrics:
         """Calculate all dashboard metrics."""
+        stage_counts = self._get_stage_counts()
+        stats = self._get_interview_stats()
+
+        passed = stats.passed or 0
+        failed = stats.failed or 0
+        completed = passed + failed
+
         return DashboardMetrics(
-            total_active_pipelines=self._count_active_pipelines(),
-            total_interviews_completed=self._count_completed_interviews(),
-            interviews_this_week=self._count_interviews_this_week(),
-            pass_rate=self._calculate_pass_rate(),
-            average_confidence=self._calculate_avg_confidence(),
+            total_active_pipelines=sum(
+                count for stage, count in stage_counts.items()
+                if stage not in _CLOSED_STAGES
+            ),
+            total_interviews_completed=completed,
+            interviews_this_week=stats.this_week or 0,
+            pass_rate=round((passed / completed) * 100, 1) if completed else 0.0,
+            average_confidence=(
+                round(stats.avg_confidence, 2) if stats.avg_confidence else 0.0
+            ),
             pending_follow_ups=self._count_pending_follow_ups(),
-            offers_received=self._count_offers(),
-            rejections=self._count_rejections(),
+            offers_received=stage_counts.get(PipelineStage.OFFER.value, 0),
+            rejections=stage_counts.get(PipelineStage.REJECTED.value, 0),
             avg_days_in_pipeline=self._calculate_avg_days_in_pipeline(),
-            stage_distribution=self._get_stage_distribution(),
-        )
-
-    def _count_active_pipelines(self) -> int:
-        """Count pipelines that are not in terminal states."""
-        stmt = (
-            select(func.count(Pipeline.id))
-            .where(
-                Pipeline.current_stage.notin_([
-                    PipelineStage.REJECTED.value,
-                    PipelineStage.DROPPED.value,
-                    PipelineStage.OFFER.value,
-                ])
-            )
+            stage_distribution={
+                stage: count for stage, count in stage_counts.items()
+                if stage not in _DROPPED_OUT_STAGES
+            },
         )
-        return self.session.execute(stmt).scalar() or 0
 
-    def _count_completed_interviews(self) -> int:
-        """Count interviews with pass or fail outcomes."""
+    def _get_stage_counts(self) -> dict[str, int]:
+        """Count all pipelines by stage in a single grouped query."""
         stmt = (
-            select(func.count(Interview.id))
-            .where(
-                Interview.outcome.in_([
-                    InterviewOutcome.PASSED.value,
-                    InterviewOutcome.FAILED.value,
-                ])
-            )
+            select(Pipeline.current_stage, func.count(Pipeline.id))
+            .group_by(Pipeline.current_stage)
         )
-        return self.session.execute(stmt).scalar() or 0
+        return dict(self.session.execute(stmt).all())
 
-    def _count_interviews_this_week(self) -> int:
-        """Count interviews scheduled for this week."""
+    def _get_interview_stats(self):
+        """
+        Aggregate interview outcomes, confidence and this week's schedule
+        in a single pass over the interviews table.
+        """
         today = date.today()
         start_of_week = today - timedelta(days=today.weekday())
         end_of_week = start_of_week + timedelta(days=6)
 
-        stmt = (
-            select(func.count(Interview.id))
-            .where(
+        stmt = select(
+            func.sum(case((Interview.outcome == InterviewOutcome.PASSED.value, 1), else_=0))
+            .label("passed"),
+            func.sum(case((Interview.outcome == InterviewOutcome.FAILED.value, 1), else_=0))
+            .label("failed"),
+            func.avg(Interview.confidence).label("avg_confidence"),
+            func.sum(case((
                 and_(
                     Interview.scheduled_date >= datetime.combine(start_of_week, datetime.min.time()),
                     Interview.scheduled_date <= datetime.combine(end_of_week, datetime.max.time()),
-                )
-            )
+                ),
+                1,
+            ), else_=0)).label("this_week"),
         )
-        return self.session.execute(stmt).scalar() or 0
-
-    def _calculate_pass_rate(self) -> float:
-        """Calculate the overall pass rate percentage."""
-        stmt = (
-            select(Interview.outcome, func.count(Interview.id))
-            .where(
-                Interview.outcome.in_([
-                    InterviewOutcome.PASSED.value,
-                    InterviewOutcome.FAILED.value,
-                ])
-            )
-            .group_by(Interview.outcome)
-        )
-        results = dict(self.session.execute(stmt).all())
-
-        passed = results.get(InterviewOutcome.PASSED.value, 0)
-        failed = results.get(InterviewOutcome.FAILED.value, 0)
-        total = passed + failed
-
-        if total == 0:
-            return 0.0
-        return round((passed / total) * 100, 1)
-
-    def _calculate_avg_confidence(self) -> float:
-        """Calculate average confidence level across all interviews."""
-        stmt = (
-            select(func.avg(Interview.confidence))
-            .where(Interview.confidence.isnot(None))
-        )
-        result = self.session.execute(stmt).scalar()
-        return round(result, 2) if result else 0.0
+        return self.session.execute(stmt).one()
 
     def _count_pending_follow_ups(self) -> int:
         """Count pipelines needing follow-up action."""
-        pipeline_service = PipelineService(self.session)
-        attention_list = pipeline_service.get_pipelines_needing_attention()
-        return len([
-            p for p, health, _ in attention_list
-            if health in [PipelineHealth.NEEDS_FOLLOWUP, PipelineHealth.STALE]
-        ])
-
-    def _count_offers(self) -> int:
-        """Count pipelines that resulted in offers."""
-        stmt = (
-            select(func.count(Pipeline.id))
-            .where(Pipeline.current_stage == PipelineStage.OFFER.value)
-        )
-        return self.session.execute(stmt).scalar() or 0
-
-    def _count_rejections(self) -> int:
-        """Count pipelines that resulted in rejections."""
-        stmt = (
-            select(func.count(Pipeline.id))
-            .where(Pipeline.current_stage == PipelineStage.REJECTED.value)
-        )
-        return self.session.execute(stmt).scalar() or 0
+        return PipelineService(self.session).count_needing_follow_up()
 
     def _calculate_avg_days_in_pipeline(self) -> float:
         """Calculate average days from application to outcome."""
+        days_in_pipeline = (
+            func.julianday(func.date(Pipeline.updated_at))
+            - func.julianday(Pipeline.applied_date)
+        )
         stmt = (
-            select(Pipeline)
+            select(func.avg(days_in_pipeline))
             .where(
                 Pipeline.current_stage.in_([
                     PipelineStage.OFFER.value,
@@ -153,38 +128,23 @@ class MetricsService:
                 ])
             )
         )
-        completed_pipelines = self.session.execute(stmt).scalars().all()
-
-        if not completed_pipelines:
-            return 0.0
-
-        total_days = sum(
-            (p.updated_at.date() - p.applied_date).days
-            for p in completed_pipelines
-        )
-        return round(total_days / len(completed_pipelines), 1)
-
-    def _get_stage_distribution(self) -> dict[str, int]:
-        """Get count of active pipelines by stage."""
-        stmt = (
-            select(Pipeline.current_stage, func.count(Pipeline.id))
-            .where(
-                Pipeline.current_stage.notin_([
-                    PipelineStage.REJECTED.value,
-                    PipelineStage.DROPPED.value,
-                ])
-            )
-            .group_by(Pipeline.current_stage)
-        )
-        results = self.session.execute(stmt).all()
-        return {stage: count for stage, count in results}
+        result = self.session.execute(stmt).scalar()
+        return round(result, 1) if result is not None else 0.0
 
     def get_upcoming_interviews(self, limit: int = 5) -> List[UpcomingInterview]:
         """Get the next upcoming interviews for dashboard display."""
         now = datetime.utcnow()
 
+        # Only the columns shown, so no ORM entities are built for these rows
         stmt = (
-            select(Interview, Pipeline)
+            select(
+                Interview.id,
+                Pipeline.company,
+                Pipeline.role,
+                Interview.stage,
+                Interview.scheduled_date,
+                Interview.prep_status,
+            )
             .join(Pipeline)
             .where(
                 and_(
@@ -198,39 +158,24 @@ class MetricsService:
 
         results = self.session.execute(stmt).all()
         upcoming = []
+        today = date.today()
 
-        for interview, pipeline in results:
-            days_until = (interview.scheduled_date.date() - date.today()).days
+        for id_, company, role, stage, scheduled_date, prep_status in results:
             upcoming.append(UpcomingInterview(
-                id=interview.id,
-                company=pipeline.company,
-                role=pipeline.role,
-                stage=interview.stage,
-                scheduled_date=interview.scheduled_date,
-                prep_status=interview.prep_status,
-                days_until=days_until,
+                id=id_,
+                company=company,
+                role=role,
+                stage=stage,
+                scheduled_date=scheduled_date,
+                prep_status=prep_status,
+                days_until=(scheduled_date.date() - today).days,
             ))
 
         return upcoming
 
     def get_pipelines_needing_attention(self, limit: int = 5) -> List[PipelineAttention]:
         """Get pipelines that need attention for dashboard display."""
-        pipeline_service = PipelineService(self.session)
-        attention_list = pipeline_service.get_pipelines_needing_attention()
-
-        result = []
-        for pipeline, health, reason in attention_list[:limit]:
-            result.append(PipelineAttention(
-                id=pipeline.id,
-                company=pipeline.company,
-                role=pipeline.role,
-                current_stage=pipeline.current_stage,
-                health=health,
-                days_since_update=pipeline.days_since_update,
-                reason=reason,
-            ))
-
-        return result
+        return PipelineService(self.session).get_pipelines_needing_attention(limit=limit)
 
     def get_weekly_summary(self) -> dict:
         """Get a summary of activity for the current week."""
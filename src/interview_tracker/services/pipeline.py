@@ -3,14 +3,15 @@
 from datetime import datetime, date, timedelta
 from typing import List, Optional
 
-from sqlalchemy import select, func
+from sqlalchemy import select, func, and_, or_, case, cast, literal, DateTime, Integer, String
 from sqlalchemy.orm import Session, joinedload
 
 from ..core.models import Pipeline, Interview
-from ..core.schemas import PipelineCreate, PipelineUpdate, PipelineRead
+from ..core.schemas import PipelineCreate, PipelineUpdate, PipelineRead, PipelineAttention
 from ..core.enums import PipelineStage, PipelineHealth, InterviewOutcome
 from ..core.state_machine import PipelineStateMachine, TransitionError
 from ..data.database import get_db
+from .session_cache import cached
 
 
 def _get_sync_manager():
@@ -19,6 +20,69 @@ def _get_sync_manager():
     return get_sync_manager()
 
 
+# Columns the pipeline form edits, read without loading the full entity
+_FORM_COLUMNS = (
+    Pipeline.company, Pipeline.role, Pipeline.job_url, Pipeline.location,
+    Pipeline.remote_policy, Pipeline.salary_range, Pipeline.priority, Pipeline.notes,
+)
+
+
+_TERMINAL_STAGES = [
+    PipelineStage.OFFER.value,
+    PipelineStage.REJECTED.value,
+    PipelineStage.DROPPED.value,
+]
+
+
+def _health_columns(now: datetime):
+    """
+    Build the SQL for each pipeline's health.
+
+    Returns (interviews, health, idle_days, wait_days): a per-pipeline
+    interview subquery to outer-join on ``interviews.c.pipeline_id``, the
+    health as a CASE over PipelineHealth values, and the whole days since
+    the last update and since the oldest overdue pending interview. Every
+    comparison uses the same ``now``.
+
+    Rules: terminal stages are closed; an upcoming interview means active;
+    an overdue pending interview means awaiting, or needs follow-up after
+    5 days; otherwise stale after 10 idle days, needs follow-up after 5.
+    """
+    now_day = func.julianday(literal(now, DateTime))
+    # Aggregated once and joined in, so the CASE branches read plain
+    # columns rather than re-running a correlated subquery per reference
+    interviews = (
+        select(
+            Interview.pipeline_id,
+            func.max(Interview.scheduled_date > now).label("has_upcoming"),
+            func.min(case(
+                (
+                    and_(
+                        Interview.outcome == InterviewOutcome.PENDING.value,
+                        Interview.scheduled_date < now,
+                    ),
+                    Interview.scheduled_date,
+                ),
+            )).label("oldest_pending"),
+        )
+        .group_by(Interview.pipeline_id)
+        .subquery()
+    )
+    idle_days = cast(now_day - func.julianday(Pipeline.updated_at), Integer)
+    wait_days = cast(now_day - func.julianday(interviews.c.oldest_pending), Integer)
+
+    health = case(
+        (Pipeline.current_stage.in_(_TERMINAL_STAGES), PipelineHealth.CLOSED.value),
+        (interviews.c.has_upcoming == 1, PipelineHealth.ACTIVE.value),
+        (wait_days > 5, PipelineHealth.NEEDS_FOLLOWUP.value),
+        (wait_days.is_not(None), PipelineHealth.AWAITING.value),
+        (idle_days > 10, PipelineHealth.STALE.value),
+        (idle_days > 5, PipelineHealth.NEEDS_FOLLOWUP.value),
+        else_=PipelineHealth.ACTIVE.value,
+    )
+    return interviews, health, idle_days, wait_days
+
+
 class PipelineService:
     """Service for managing pipelines."""
 
@@ -61,6 +125,12 @@ class PipelineService:
         """Get a pipeline by ID."""
         return self.session.get(Pipeline, pipeline_id)
 
+    def get_for_form(self, pipeline_id: int) -> Optional[dict]:
+        """Get the form-editable columns of a pipeline as a dict."""
+        stmt = select(*_FORM_COLUMNS).where(Pipeline.id == pipeline_id)
+        row = self.session.execute(stmt).first()
+        return row._asdict() if row else None
+
     def get_with_interviews(self, pipeline_id: int) -> Optional[Pipeline]:
         """Get a pipeline with its interviews loaded."""
         stmt = (
@@ -176,86 +246,93 @@ class PipelineService:
         self.session.commit()
         return True
 
-    def calculate_health(self, pipeline: Pipeline) -> PipelineHealth:
-        """Calculate the health status of a pipeline."""
-        stage = PipelineStage(pipeline.current_stage)
-
-        # Terminal states
-        if PipelineStateMachine.is_terminal(stage):
-            return PipelineHealth.CLOSED
-
-        days_since_update = (datetime.utcnow() - pipeline.updated_at).days
+    def get_health(self, pipeline_id: Optional[int] = None) -> dict[int, PipelineHealth]:
+        """
+        Get the health of one pipeline, or of every pipeline, by id.
 
-        # Check for upcoming interviews
-        upcoming_interviews = [
-            i for i in pipeline.interviews
-            if i.scheduled_date and i.scheduled_date > datetime.utcnow()
-        ]
-        if upcoming_interviews:
-            return PipelineHealth.ACTIVE
-
-        # Check for pending outcomes (interview done, waiting for result)
-        pending_interviews = [
-            i for i in pipeline.interviews
-            if i.outcome == InterviewOutcome.PENDING.value
-            and i.scheduled_date
-            and i.scheduled_date < datetime.utcnow()
-        ]
+        Computed in SQL, so the interviews are never loaded.
+        """
+        interviews, health, _, _ = _health_columns(datetime.utcnow())
+        stmt = (
+            select(Pipeline.id, health)
+            .outerjoin(interviews, interviews.c.pipeline_id == Pipeline.id)
+        )
+        if pipeline_id is not None:
+            stmt = stmt.where(Pipeline.id == pipeline_id)
+        return {
+            pid: PipelineHealth(value)
+            for pid, value in self.session.execute(stmt).all()
+        }
+
+    def _attention_query(self):
+        """Select active pipelines that need attention, most recently updated first."""
+        interviews, health, idle_days, wait_days = _health_columns(datetime.utcnow())
+        idle_text = cast(idle_days, String) + " days"
+        reason = case(
+            (health == PipelineHealth.STALE.value, "Stale - no updates for " + idle_text),
+            (health == PipelineHealth.AWAITING.value,
+             "Awaiting response for " + cast(wait_days, String) + " days"),
+            else_="No activity for " + idle_text,
+        )
 
-        if pending_interviews:
-            oldest = min(i.scheduled_date for i in pending_interviews)
-            days_waiting = (datetime.utcnow() - oldest).days
-            if days_waiting > 5:
-                return PipelineHealth.NEEDS_FOLLOWUP
-            return PipelineHealth.AWAITING
+        return (
+            select(
+                Pipeline.id,
+                Pipeline.company,
+                Pipeline.role,
+                Pipeline.current_stage,
+                health.label("health"),
+                idle_days.label("days_since_update"),
+                reason.label("reason"),
+            )
+            .outerjoin(interviews, interviews.c.pipeline_id == Pipeline.id)
+            .where(
+                Pipeline.current_stage.notin_(_TERMINAL_STAGES),
+                or_(
+                    health.in_([
+                        PipelineHealth.NEEDS_FOLLOWUP.value,
+                        PipelineHealth.STALE.value,
+                    ]),
+                    # Awaiting only counts once the wait passes three days
+                    and_(health == PipelineHealth.AWAITING.value, wait_days > 3),
+                ),
+            )
+            .order_by(Pipeline.updated_at.desc())
+        )
 
-        # Check for staleness
-        if days_since_update > 10:
-            return PipelineHealth.STALE
-        elif days_since_update > 5:
-            return PipelineHealth.NEEDS_FOLLOWUP
+    def get_pipelines_needing_attention(
+        self, limit: Optional[int] = None
+    ) -> List[PipelineAttention]:
+        """Get pipelines that need user attention with reasons."""
+        return cached(
+            self.session,
+            ("pipelines_needing_attention", limit),
+            lambda: self._compute_pipelines_needing_attention(limit),
+        )
 
-        return PipelineHealth.ACTIVE
+    def _compute_pipelines_needing_attention(
+        self, limit: Optional[int]
+    ) -> List[PipelineAttention]:
+        stmt = self._attention_query()
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return [
+            PipelineAttention(**row._asdict())
+            for row in self.session.execute(stmt).all()
+        ]
 
-    def get_pipelines_needing_attention(self) -> List[tuple[Pipeline, PipelineHealth, str]]:
-        """Get pipelines that need user attention with reasons."""
-        pipelines = self.get_active()
-        attention_needed = []
-
-        for pipeline in pipelines:
-            health = self.calculate_health(pipeline)
-
-            if health == PipelineHealth.NEEDS_FOLLOWUP:
-                attention_needed.append((
-                    pipeline,
-                    health,
-                    f"No activity for {pipeline.days_since_update} days"
-                ))
-            elif health == PipelineHealth.STALE:
-                attention_needed.append((
-                    pipeline,
-                    health,
-                    f"Stale - no updates for {pipeline.days_since_update} days"
-                ))
-            elif health == PipelineHealth.AWAITING:
-                # Check if waiting too long
-                pending = [
-                    i for i in pipeline.interviews
-                    if i.outcome == InterviewOutcome.PENDING.value
-                    and i.scheduled_date
-                    and i.scheduled_date < datetime.utcnow()
-                ]
-                if pending:
-                    oldest = min(i.scheduled_date for i in pending)
-                    days = (datetime.utcnow() - oldest).days
-                    if days > 3:
-                        attention_needed.append((
-                            pipeline,
-                            health,
-                            f"Awaiting response for {days} days"
-                        ))
-
-        return attention_needed
+    def count_needing_follow_up(self) -> int:
+        """Count pipelines that need follow-up or have gone stale."""
+        attention = self._attention_query().subquery()
+        stmt = (
+            select(func.count())
+            .select_from(attention)
+            .where(attention.c.health.in_([
+                PipelineHealth.NEEDS_FOLLOWUP.value,
+                PipelineHealth.STALE.value,
+            ]))
+        )
+        return self.session.execute(stmt).scalar_one()
 
     def get_stage_distribution(self) -> dict[str, int]:
         """Get count of pipelines in each stage."""
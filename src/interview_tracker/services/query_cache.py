@@ -0,0 +1,66 @@
+"""Process-wide, short-lived cache for query results shown in the GUI.
+
+Unlike ``session_cache``, values here outlive the session that computed
+them, so only plain data (schemas, dicts, tuples) may be stored - never
+ORM instances. Entries expire after a TTL, and the whole cache is dropped
+whenever any session writes and again when it commits, so a change is
+visible on the next read.
+"""
+
+import logging
+import time
+from typing import Any, Callable, Hashable
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+logger = logging.getLogger(__name__)
+
+# key -> (expires_at, value)
+_entries: dict[Hashable, tuple[float, Any]] = {}
+# Bumped on every invalidation so a value computed across a write is not stored
+_generation = 0
+
+
+def get_cached(key: Hashable, ttl: float, factory: Callable[[], Any]) -> Any:
+    """Return the cached value for key, computing it with factory when missing or expired."""
+    entry = _entries.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        logger.debug("Query cache hit: %r", key)
+        return entry[1]
+
+    logger.debug("Query cache miss: %r", key)
+    generation = _generation
+    value = factory()
+    if generation == _generation:
+        _entries[key] = (time.monotonic() + ttl, value)
+    return value
+
+
+def invalidate_query_cache() -> None:
+    """Drop every cached query result."""
+    global _generation
+    _generation += 1
+    _entries.clear()
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_after_flush(session, flush_context):
+    invalidate_query_cache()
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    # A reader that ran between the flush and the commit saw the old
+    # snapshot but stored it under the newer generation; drop it again
+    invalidate_query_cache()
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_after_bulk_write(orm_execute_state: ORMExecuteState):
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        invalidate_query_cache()
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import select, or_
+from sqlalchemy import select, insert, or_
 from sqlalchemy.orm import Session, joinedload
 
 from ..core.models import InterviewQuestion, Interview
@@ -11,6 +11,29 @@ from ..core.schemas import QuestionCreate, QuestionUpdate
 from ..core.enums import QuestionType
 from ..data.database import get_db
 
+# Columns the question form edits, read without loading the full entity
+_FORM_COLUMNS = (
+    InterviewQuestion.question_text, InterviewQuestion.question_type,
+    InterviewQuestion.my_answer, InterviewQuestion.ideal_answer,
+    InterviewQuestion.rating, InterviewQuestion.gap_identified,
+    InterviewQuestion.action_item, InterviewQuestion.tags,
+)
+
+
+def _question_values(data: QuestionCreate) -> dict:
+    """Map a QuestionCreate onto InterviewQuestion column values."""
+    return {
+        "interview_id": data.interview_id,
+        "question_text": data.question_text,
+        "question_type": data.question_type.value,
+        "my_answer": data.my_answer,
+        "ideal_answer": data.ideal_answer,
+        "rating": data.rating,
+        "gap_identified": data.gap_identified,
+        "action_item": data.action_item,
+        "tags": data.tags or [],
+    }
+
 
 class QuestionService:
     """Service for managing the question bank."""
@@ -26,29 +49,36 @@ class QuestionService:
 
     def create(self, data: QuestionCreate) -> InterviewQuestion:
         """Create a new question."""
-        question = InterviewQuestion(
-            interview_id=data.interview_id,
-            question_text=data.question_text,
-            question_type=data.question_type.value,
-            my_answer=data.my_answer,
-            ideal_answer=data.ideal_answer,
-            rating=data.rating,
-            gap_identified=data.gap_identified,
-            action_item=data.action_item,
-        )
-
-        if data.tags:
-            question.tags = data.tags
+        question = InterviewQuestion(**_question_values(data))
 
         self.session.add(question)
         self.session.commit()
         self.session.refresh(question)
         return question
 
+    def create_many(self, items: List[QuestionCreate]) -> int:
+        """
+        Insert many questions in a single transaction (e.g. when importing
+        a question bank). Returns the number of rows inserted.
+        """
+        if not items:
+            return 0
+
+        rows = [_question_values(data) for data in items]
+        self.session.execute(insert(InterviewQuestion), rows)
+        self.session.commit()
+        return len(rows)
+
     def get(self, question_id: int) -> Optional[InterviewQuestion]:
         """Get a question by ID."""
         return self.session.get(InterviewQuestion, question_id)
 
+    def get_for_form(self, question_id: int) -> Optional[dict]:
+        """Get the form-editable columns of a question as a dict."""
+        stmt = select(*_FORM_COLUMNS).where(InterviewQuestion.id == question_id)
+        row = self.session.execute(stmt).first()
+        return row._asdict() if row else None
+
     def get_all(self) -> List[InterviewQuestion]:
         """Get all questions."""
         stmt = (
@@ -124,8 +124,8 @@ class ReminderService:
             return
 
         follow_up_count = len([
-            (p, h, r) for p, h, r in attention_needed
-            if h == PipelineHealth.NEEDS_FOLLOWUP
+            item for item in attention_needed
+            if item.health == PipelineHealth.NEEDS_FOLLOWUP
         ])
 
         if follow_up_count > 0:
@@ -183,7 +183,7 @@ class DailySummary:
 
             # Pending follow-ups
             attention = pipeline_service.get_pipelines_needing_attention()
-            follow_ups = [(p, h, r) for p, h, r in attention if h == PipelineHealth.NEEDS_FOLLOWUP]
+            follow_ups = [item for item in attention if item.health == PipelineHealth.NEEDS_FOLLOWUP]
 
             # Build summary
             lines = ["=== Daily Interview Summary ===", ""]
@@ -198,8 +198,8 @@ class DailySummary:
 
             if follow_ups:
                 lines.append(f"Follow-ups needed: {len(follow_ups)}")
-                for pipeline, health, reason in follow_ups[:5]:
-                    lines.append(f"  - {pipeline.company}: {reason}")
+                for item in follow_ups[:5]:
+                    lines.append(f"  - {item.company}: {item.reason}")
                 lines.append("")
 
             # Active pipelines count
@@ -0,0 +1,46 @@
+"""Request-scoped cache stored on a SQLAlchemy session.
+
+The GUI opens one short-lived session per user action. Values derived from
+ORM rows (e.g. the list of pipelines needing attention) can be cached in
+``session.info`` for the lifetime of that session and are dropped as soon
+as the session flushes or rolls back, so callers never see stale results.
+"""
+
+from typing import Any, Callable, Hashable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_CACHE_KEY = "cache"
+
+
+def get_session_cache(session: Session) -> dict:
+    """Get the cache dict attached to a session, creating it if needed."""
+    return session.info.setdefault(_CACHE_KEY, {})
+
+
+def cached(session: Session, key: Hashable, factory: Callable[[], Any]) -> Any:
+    """Return the cached value for key, computing it with factory on a miss."""
+    cache = get_session_cache(session)
+    try:
+        return cache[key]
+    except KeyError:
+        value = cache[key] = factory()
+        return value
+
+
+def clear_session_cache(session: Session) -> None:
+    """Drop all cached values for a session."""
+    cache = session.info.get(_CACHE_KEY)
+    if cache:
+        cache.clear()
+
+
+@event.listens_for(Session, "after_flush")
+def _clear_after_flush(session, flush_context):
+    clear_session_cache(session)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _clear_after_rollback(session, previous_transaction):
+    clear_session_cache(session)
@@ -0,0 +1,84 @@
+"""Tests for the question bank service."""
+
+import pytest
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import Session
+
+from interview_tracker.core.enums import QuestionType
+from interview_tracker.core.models import Base, InterviewQuestion
+from interview_tracker.core.schemas import QuestionCreate
+from interview_tracker.services.questions import QuestionService
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_create_many_inserts_in_one_transaction(engine):
+    commits = []
+    event.listen(engine, "commit", lambda conn: commits.append(conn))
+
+    items = [
+        QuestionCreate(
+            question_text=f"Question {i}",
+            question_type=QuestionType.TECHNICAL,
+            tags=[f"tag-{i}", "shared"] if i % 2 else None,
+        )
+        for i in range(50)
+    ]
+
+    with Session(engine) as session:
+        assert QuestionService(session).create_many(items) == 50
+
+    assert len(commits) == 1
+
+    with Session(engine) as session:
+        count = session.execute(
+            select(func.count()).select_from(InterviewQuestion)
+        ).scalar_one()
+        assert count == 50
+
+        questions = session.execute(
+            select(InterviewQuestion).order_by(InterviewQuestion.id)
+        ).scalars().all()
+        assert questions[0].tags == []
+        assert questions[1].tags == ["tag-1", "shared"]
+        assert questions[1].question_type == QuestionType.TECHNICAL.value
+
+
+def test_create_many_with_no_items_skips_the_database(engine):
+    commits = []
+    event.listen(engine, "commit", lambda conn: commits.append(conn))
+
+    with Session(engine) as session:
+        assert QuestionService(session).create_many([]) == 0
+
+    assert commits == []
+
+
+def test_create_and_create_many_store_the_same_values(engine):
+    data = QuestionCreate(
+        question_text="Design a rate limiter",
+        question_type=QuestionType.SYSTEM_DESIGN,
+        rating=3,
+        gap_identified="Token bucket details",
+        tags=["design"],
+    )
+
+    with Session(engine) as session:
+        service = QuestionService(session)
+        single = service.create(data)
+        service.create_many([data])
+
+        single_id = single.id
+        bulk = session.execute(
+            select(InterviewQuestion).where(InterviewQuestion.id != single_id)
+        ).scalar_one()
+
+        for column in ("question_text", "question_type", "rating",
+                       "gap_identified", "tags"):
+            assert getattr(bulk, column) == getattr(single, column)